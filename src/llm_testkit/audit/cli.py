@@ -6,11 +6,10 @@
 import argparse
 import asyncio
 import sys
+import traceback
+from collections.abc import Callable
 from pathlib import Path
 
-from llm_testkit.audit.config import AuditConfig
-from llm_testkit.audit.runner import AuditRunner
-
 
 def register_subcommand(subparsers: argparse._SubParsersAction) -> None:
     """註冊 audit subcommand。
@@ -51,7 +50,25 @@ def audit_main(args: argparse.Namespace) -> int:
     Returns:
         退出碼（0 表示成功，1 表示失敗）
     """
-    return asyncio.run(_async_audit_main(args))
+    return asyncio.run(_async_audit_main(args), loop_factory=_event_loop_factory())
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """取得事件迴圈工廠。
+
+    已安裝 uvloop（僅支援 POSIX）時使用其事件迴圈以降低每個請求的 asyncio 開銷；
+    Windows 或未安裝時回傳 None，沿用 asyncio 預設事件迴圈。
+
+    Returns:
+        uvloop 的事件迴圈工廠，或 None
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 async def _async_audit_main(args: argparse.Namespace) -> int:
@@ -69,19 +86,31 @@ async def _async_audit_main(args: argparse.Namespace) -> int:
         print(f"錯誤: 配置檔不存在: {config_path}", file=sys.stderr)
         return 1
 
+    # 延遲導入：避免 --help 或參數錯誤時載入 transformers / openai 等重量級依賴
+    from llm_testkit.audit.config import AuditConfig
+
     try:
         # 載入配置
         print(f"載入配置檔: {config_path}")
+
+        # 先快速檢查套件是否存在，避免套件名稱錯誤時仍完整解析配置
+        suites = AuditConfig.probe_suites(config_path)
+        if suites and args.suite not in suites:
+            available = ", ".join(sorted(suites))
+            raise ValueError(f"測試套件 '{args.suite}' 不存在。可用套件: {available}")
+
         config = AuditConfig.from_yaml(config_path)
 
-        # 建立審計執行器
+        # 建立審計執行器（配置驗證通過後才載入執行器與其依賴）
+        from llm_testkit.audit.runner import AuditRunner
+
         runner = AuditRunner(config)
 
         try:
             # 執行審計
             print(f"\n開始執行審計套件: {args.suite}")
             print("=" * 60)
-            results = await runner.run_suite(args.suite)
+            results = await runner.run_suite_list(args.suite)
 
             # 產生報告
             print("\n" + "=" * 60)
@@ -100,15 +129,20 @@ async def _async_audit_main(args: argparse.Namespace) -> int:
             return 0 if passed_count == total_count else 1
 
         finally:
-            # 確保關閉資源
+            # 確保關閉資源；共用的 HTTP 連線池需在同一事件迴圈內關閉
+            from llm_testkit.backend.openai_api import shutdown_clients
+
             await runner.close()
+            await shutdown_clients()
+            # Anthropic 客戶端只在已被載入時才需要關閉（避免為此導入 anthropic SDK）
+            anthropic_api = sys.modules.get("llm_testkit.backend.anthropic_api")
+            if anthropic_api is not None:
+                await anthropic_api.AnthropicAPI.shutdown_all()
 
     except ValueError as e:
         print(f"配置錯誤: {e}", file=sys.stderr)
         return 1
     except Exception as e:
         print(f"執行錯誤: {e}", file=sys.stderr)
-        import traceback
-
         traceback.print_exc()
         return 1
@@ -3,13 +3,28 @@
 提供審計系統的配置模型與載入功能。
 """
 
+import math
 from dataclasses import dataclass
 from pathlib import Path
 
-from llm_testkit.utils.config import load_yaml
+from llm_testkit.utils.config import load_yaml, probe_yaml_section_keys
 
+# 配置檔必要區塊（依序回報第一個缺少的區塊）
+_REQUIRED_SECTIONS = ("endpoint", "tokenizer", "decoding", "suites", "thresholds", "run")
+_REQUIRED_SECTIONS_SET = frozenset(_REQUIRED_SECTIONS)
 
-@dataclass
+# ThresholdsConfig 驗證表：(欄位名稱, 下限, 上限, 錯誤說明)
+_THRESHOLD_CHECKS: tuple[tuple[str, float, float, str], ...] = (
+    ("fingerprint_avg_diff_pct", 0.0, math.inf, " >= 0"),
+    ("perturb_top1_change_pct", 0.0, 100.0, "在 0-100 之間"),
+    ("arithmetic_acc", 0.0, 1.0, "在 0.0-1.0 之間"),
+    ("json_valid_rate", 0.0, 1.0, "在 0.0-1.0 之間"),
+    ("style_fixed_prefix_rate", 0.0, 1.0, "在 0.0-1.0 之間"),
+    ("style_format_violation_rate", 0.0, 1.0, "在 0.0-1.0 之間"),
+)
+
+
+@dataclass(slots=True)
 class EndpointConfig:
     """API 端點配置。"""
 
@@ -17,6 +32,7 @@ class EndpointConfig:
     model: str
     api_key: str | None = None
     supports_logprobs: bool = False
+    disable_http2: bool = False
 
     def __post_init__(self):
         """驗證配置。"""
@@ -26,11 +42,12 @@ class EndpointConfig:
             raise ValueError("endpoint.model 不能為空")
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenizerConfig:
     """分詞器配置。"""
 
     model_name_or_path: str
+    disk_cache: bool = False
 
     def __post_init__(self):
         """驗證配置。"""
@@ -38,7 +55,7 @@ class TokenizerConfig:
             raise ValueError("tokenizer.model_name_or_path 不能為空")
 
 
-@dataclass
+@dataclass(slots=True)
 class DecodingConfig:
     """解碼參數配置。"""
 
@@ -46,6 +63,7 @@ class DecodingConfig:
     top_p: float = 1.0
     max_tokens: int = 128
     seed: int = 1234
+    row_marshal_fingerprint: bool = False
 
     def __post_init__(self):
         """驗證配置。"""
@@ -57,7 +75,7 @@ class DecodingConfig:
             raise ValueError(f"max_tokens 必須大於 0，當前值: {self.max_tokens}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ThresholdsConfig:
     """檢測閾值配置。"""
 
@@ -70,21 +88,12 @@ class ThresholdsConfig:
 
     def __post_init__(self):
         """驗證配置。"""
-        if self.fingerprint_avg_diff_pct < 0:
-            raise ValueError("fingerprint_avg_diff_pct 必須 >= 0")
-        if not 0.0 <= self.perturb_top1_change_pct <= 100.0:
-            raise ValueError("perturb_top1_change_pct 必須在 0-100 之間")
-        if not 0.0 <= self.arithmetic_acc <= 1.0:
-            raise ValueError("arithmetic_acc 必須在 0.0-1.0 之間")
-        if not 0.0 <= self.json_valid_rate <= 1.0:
-            raise ValueError("json_valid_rate 必須在 0.0-1.0 之間")
-        if not 0.0 <= self.style_fixed_prefix_rate <= 1.0:
-            raise ValueError("style_fixed_prefix_rate 必須在 0.0-1.0 之間")
-        if not 0.0 <= self.style_format_violation_rate <= 1.0:
-            raise ValueError("style_format_violation_rate 必須在 0.0-1.0 之間")
-
-
-@dataclass
+        for field_name, low, high, rule in _THRESHOLD_CHECKS:
+            if not low <= getattr(self, field_name) <= high:
+                raise ValueError(f"{field_name} 必須{rule}")
+
+
+@dataclass(slots=True)
 class RunConfig:
     """執行配置。"""
 
@@ -92,6 +101,7 @@ class RunConfig:
     rate_limit_sleep: float = 0.2
     retries: int = 2
     timeout_sec: int = 60
+    coalesce: bool = False
 
     def __post_init__(self):
         """驗證配置。"""
@@ -105,7 +115,7 @@ class RunConfig:
             raise ValueError(f"timeout_sec 必須大於 0，當前值: {self.timeout_sec}")
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditConfig:
     """審計總配置。"""
 
@@ -117,6 +127,30 @@ class AuditConfig:
     run: RunConfig
     control_endpoint: EndpointConfig | None = None
 
+    @staticmethod
+    def probe_suites(filepath: str | Path) -> set[str]:
+        """僅讀取配置檔中的套件名稱，不解析完整配置。
+
+        用於在完整載入前快速檢查 --suite 是否存在。
+
+        Args:
+            filepath: 配置檔路徑
+
+        Returns:
+            套件名稱集合（suites 區塊不存在或格式錯誤時為空集合）
+
+        Raises:
+            FileNotFoundError: 配置檔不存在
+        """
+        suites = probe_yaml_section_keys(filepath, "suites")
+        if suites is not None:
+            return suites
+
+        # 串流解析無法判斷時，退回完整解析
+        config_dict = load_yaml(filepath)
+        suites_data = config_dict.get("suites") if isinstance(config_dict, dict) else None
+        return {str(name) for name in suites_data} if isinstance(suites_data, dict) else set()
+
     @classmethod
     def from_yaml(cls, filepath: str | Path) -> "AuditConfig":
         """從 YAML 載入配置。
@@ -132,12 +166,14 @@ class AuditConfig:
             ValueError: 配置驗證失敗
         """
         config_dict = load_yaml(filepath)
+        if not isinstance(config_dict, dict):
+            raise ValueError(f"配置檔頂層必須是字典格式: {filepath}")
 
         # 驗證必要區塊
-        required_sections = ["endpoint", "tokenizer", "decoding", "suites", "thresholds", "run"]
-        for section in required_sections:
-            if section not in config_dict:
-                raise ValueError(f"配置檔缺少必要區塊: {section}")
+        missing = _REQUIRED_SECTIONS_SET.difference(config_dict.keys())
+        if missing:
+            section = next(s for s in _REQUIRED_SECTIONS if s in missing)
+            raise ValueError(f"配置檔缺少必要區塊: {section}")
 
         # 解析 endpoint
         endpoint_data = config_dict["endpoint"]
@@ -167,11 +203,12 @@ class AuditConfig:
         run = RunConfig(**run_data)
 
         # 解析 control_endpoint（完全可選，不存在也不影響）
-        control_endpoint = None
-        if config_dict.get("control_endpoint") is not None:
-            control_endpoint_data = config_dict["control_endpoint"]
-            if isinstance(control_endpoint_data, dict):
-                control_endpoint = EndpointConfig(**control_endpoint_data)
+        control_endpoint_data = config_dict.get("control_endpoint")
+        control_endpoint = (
+            EndpointConfig(**control_endpoint_data)
+            if isinstance(control_endpoint_data, dict)
+            else None
+        )
 
         return cls(
             endpoint=endpoint,
@@ -3,11 +3,16 @@
 此模組包含所有審計檢測器的實作。
 """
 
-from .arithmetic_json import ArithmeticJsonDetector
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import BaseDetector, DetectorResult
-from .perturbation import PerturbationDetector
-from .style_bias import StyleBiasDetector
-from .tokenizer_fingerprint import TokenizerFingerprintDetector
+
+if TYPE_CHECKING:
+    from .arithmetic_json import ArithmeticJsonDetector
+    from .perturbation import PerturbationDetector
+    from .style_bias import StyleBiasDetector
+    from .tokenizer_fingerprint import TokenizerFingerprintDetector
 
 __all__ = [
     "BaseDetector",
@@ -17,3 +22,22 @@ __all__ = [
     "ArithmeticJsonDetector",
     "StyleBiasDetector",
 ]
+
+# 檢測器類別名稱 -> 所在子模組，首次存取時才載入
+_LAZY_DETECTORS = {
+    "ArithmeticJsonDetector": ".arithmetic_json",
+    "PerturbationDetector": ".perturbation",
+    "StyleBiasDetector": ".style_bias",
+    "TokenizerFingerprintDetector": ".tokenizer_fingerprint",
+}
+
+
+def __getattr__(name: str):
+    """延遲導入檢測器，僅載入實際使用到的檢測器模組。"""
+    module_name = _LAZY_DETECTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -8,12 +8,35 @@ import asyncio
 import random
 
 from llm_testkit.audit.config import DecodingConfig, ThresholdsConfig
-from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult
+from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult, keyed, q2
 from llm_testkit.backend.openai_api import OpenAICompatibleAPI
 from llm_testkit.core.metrics import extract_first_int, json_valid
 from llm_testkit.core.tokenizer import Tokenizer
 
 
+def _build_test_cases(total: int = 20, seed: int = 1234) -> tuple[tuple[str, int], ...]:
+    """產生算術測題（使用固定種子確保可重複）。
+
+    Args:
+        total: 測題數量
+        seed: 隨機種子
+
+    Returns:
+        (提示文字, 預期答案) 組成的 tuple
+    """
+    rng = random.Random(seed)
+
+    test_cases = []
+    for _ in range(total):
+        a = rng.randint(12, 97)
+        b = rng.randint(12, 97)
+        expected = a * b
+        prompt = f"Multiply {a}×{b}. Output only the integer."
+        test_cases.append((prompt, expected))
+
+    return tuple(test_cases)
+
+
 class ArithmeticJsonDetector(BaseDetector):
     """算術與 JSON 結構完整性檢測器。
 
@@ -30,6 +53,9 @@ class ArithmeticJsonDetector(BaseDetector):
     6. 若相較基線掉分超過閾值，標記為「量化影響或強制後處理」
     """
 
+    # 算術測題：種子與範圍固定，於類別載入時產生一次
+    _TEST_CASES: tuple[tuple[str, int], ...] = _build_test_cases()
+
     @property
     def name(self) -> str:
         """回傳檢測器名稱。"""
@@ -53,40 +79,38 @@ class ArithmeticJsonDetector(BaseDetector):
         Returns:
             檢測結果，包含算術正確率與 JSON 合法率
         """
-        # 產生算術測題
-        arithmetic_total = 20
-        rng = random.Random(1234)
-
-        test_cases = []
-        for _ in range(arithmetic_total):
-            a = rng.randint(12, 97)
-            b = rng.randint(12, 97)
-            expected = a * b
-            prompt = f"Multiply {a}×{b}. Output only the integer."
-            test_cases.append((prompt, expected))
+        # 算術測題
+        test_cases = self._TEST_CASES
+        arithmetic_total = len(test_cases)
 
         # 加入 JSON 測試
         json_prompt = 'Complete valid JSON with keys ["id","name","tags"]. Output JSON only.'
 
-        # 併發執行所有 API 呼叫（算術 + JSON）
-        tasks = [self._call_api(api, prompt, decoding) for prompt, _ in test_cases]
-        tasks.append(self._call_api(api, json_prompt, decoding))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 併發執行所有 API 呼叫（算術 + JSON），以索引標記；JSON 測試使用索引 arithmetic_total
+        pending = [
+            keyed(idx, self._call_api(api, prompt, decoding))
+            for idx, (prompt, _) in enumerate(test_cases)
+        ]
+        pending.append(keyed(arithmetic_total, self._call_api(api, json_prompt, decoding)))
 
-        # 處理算術測試結果
+        # 依完成順序處理結果，讓答案比對與其餘請求的網路等待重疊
         arithmetic_correct = 0
         arithmetic_failed = 0
-        for (_, expected), result in zip(test_cases, results[:arithmetic_total], strict=False):
-            if isinstance(result, Exception):
+        json_request_ok = False
+        json_result: str | Exception = ""
+        for next_done in asyncio.as_completed(pending):
+            idx, ok, result = await next_done
+
+            if idx == arithmetic_total:
+                json_request_ok, json_result = ok, result
+                continue
+
+            if not ok:
                 arithmetic_failed += 1
                 continue
 
-            # 確保 result 是字串
-            if isinstance(result, str):
-                extracted = extract_first_int(result)
-                if extracted == expected:
-                    arithmetic_correct += 1
+            if extract_first_int(result) == test_cases[idx][1]:
+                arithmetic_correct += 1
 
         arithmetic_valid = arithmetic_total - arithmetic_failed
         arithmetic_acc = arithmetic_correct / arithmetic_valid if arithmetic_valid > 0 else 0.0
@@ -95,15 +119,13 @@ class ArithmeticJsonDetector(BaseDetector):
         )
 
         # 處理 JSON 測試結果
-        json_result = results[-1]
-        json_failed = isinstance(json_result, Exception)
+        json_failed = not json_request_ok
 
         if json_failed:
             json_ok = False
             notes = f"JSON 測試請求失敗: {str(json_result)}"
         else:
-            # 確保 json_result 是字串
-            json_ok = json_valid(json_result) if isinstance(json_result, str) else False
+            json_ok = json_valid(json_result)
             notes = ""
 
         if arithmetic_failed > 0:
@@ -119,11 +141,11 @@ class ArithmeticJsonDetector(BaseDetector):
             name=self.name,
             passed=passed,
             metrics={
-                "arithmetic_acc": round(arithmetic_acc, 2),
+                "arithmetic_acc": q2(arithmetic_acc),
                 "arithmetic_correct": arithmetic_correct,
                 "arithmetic_total": arithmetic_valid,
                 "arithmetic_failed": arithmetic_failed,
-                "arithmetic_success_rate": round(arithmetic_success_rate, 2),
+                "arithmetic_success_rate": q2(arithmetic_success_rate),
                 "json_valid_sample": bool(json_ok),
                 "json_failed": json_failed,
                 "threshold_arithmetic": thresholds.arithmetic_acc,
@@ -145,8 +167,7 @@ class ArithmeticJsonDetector(BaseDetector):
         Returns:
             API 回應的文字內容
         """
-        messages = [{"role": "user", "content": prompt}]
-        response = await api.generate(
-            messages=messages, temperature=decoding.temperature, max_tokens=decoding.max_tokens
+        response = await api.generate_user(
+            prompt, temperature=decoding.temperature, max_tokens=decoding.max_tokens
         )
         return response.choices[0].message.content
@@ -5,7 +5,8 @@ along with the standard result format.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
+from collections.abc import Awaitable
+from dataclasses import dataclass
 from typing import Any
 
 from llm_testkit.audit.config import DecodingConfig, ThresholdsConfig
@@ -13,6 +14,43 @@ from llm_testkit.backend.openai_api import OpenAICompatibleAPI
 from llm_testkit.core.tokenizer import Tokenizer
 
 
+async def keyed[K, T](key: K, awaitable: Awaitable[T]) -> tuple[K, bool, T | Exception]:
+    """Await a request and pair its outcome with a caller-supplied key.
+
+    Exceptions are returned instead of raised, together with an explicit
+    success flag, so detectors consuming ``asyncio.as_completed`` can tell
+    which request each result belongs to and branch on the flag rather than
+    type-checking the value.
+
+    Args:
+        key: Identifier for the request (index, prompt, etc.)
+        awaitable: The request to await
+
+    Returns:
+        Tuple of the key, whether the request succeeded, and either the
+        result or the raised exception
+    """
+    try:
+        return key, True, await awaitable
+    except Exception as e:
+        return key, False, e
+
+
+def q2(value: float | None) -> float | None:
+    """Quantize a metric to two decimal places for reporting.
+
+    All detectors report rates and percentages through this helper so metrics
+    share one rounding rule; ``None`` (metric unavailable) passes through.
+
+    Args:
+        value: Raw metric value, or None
+
+    Returns:
+        The value rounded to two decimals, or None
+    """
+    return None if value is None else float(f"{value:.2f}")
+
+
 @dataclass
 class DetectorResult:
     """Standard result format for detector execution.
@@ -35,7 +73,12 @@ class DetectorResult:
         Returns:
             Dictionary representation of the result
         """
-        return asdict(self)
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "metrics": self.metrics,
+            "notes": self.notes,
+        }
 
 
 class BaseDetector(ABC):
@@ -5,13 +5,22 @@
 """
 
 import asyncio
+import functools
+import re
 
 from llm_testkit.audit.config import DecodingConfig, ThresholdsConfig
-from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult
+from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult, keyed, q2
 from llm_testkit.backend.openai_api import OpenAICompatibleAPI
 from llm_testkit.core.metrics import hamming_distance
 from llm_testkit.core.tokenizer import Tokenizer
 
+# 簡單的同義詞替換規則，以單一正則一次掃描完成所有替換
+_SYN_MAP = {"three": "3", "三個": "3個", "one": "1", "一句話": "1句話"}
+_SYN_RE = re.compile("|".join(map(re.escape, _SYN_MAP)))
+
+# 比較回應前綴的 token 數（Hamming@k）
+_PREFIX_TOKENS = 10
+
 
 class PerturbationDetector(BaseDetector):
     """微擾穩定性檢測器。
@@ -58,29 +67,45 @@ class PerturbationDetector(BaseDetector):
         Returns:
             檢測結果，包含 Top-1 變更率、平均 Hamming 距離與測試對數
         """
-        # 準備所有 API 呼叫任務
-        tasks = []
-        for base_prompt in self.BASE_PROMPTS:
-            # 產生擾動版本
-            perturbed_prompts = [
+        # 產生擾動版本（僅建立一次，供呼叫與評分共用）
+        perturbations: dict[str, list[str]] = {
+            base_prompt: [
                 base_prompt + " ",  # 末尾空白
                 base_prompt + "\n",  # 末尾換行
                 self._apply_synonym_replacement(base_prompt),  # 同義替換
             ]
+            for base_prompt in self.BASE_PROMPTS
+        }
 
+        # 準備所有 API 呼叫任務（相同提示只呼叫一次，例如同義替換未命中時）
+        tasks: dict[str, asyncio.Task[str]] = {}
+        for base_prompt, perturbed_prompts in perturbations.items():
             # 加入原始提示和所有擾動版本的呼叫任務
-            tasks.append((base_prompt, self._call_api(api, base_prompt, decoding)))
-            for pert_prompt in perturbed_prompts:
-                tasks.append((pert_prompt, self._call_api(api, pert_prompt, decoding)))
-
-        # 併發執行所有 API 呼叫
-        results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+            for prompt in (base_prompt, *perturbed_prompts):
+                if prompt not in tasks:
+                    tasks[prompt] = asyncio.create_task(
+                        self._call_api(api, tokenizer, prompt, decoding)
+                    )
+
+        # 相同回應只分詞一次
+        tok_cache: dict[str, list[int]] = {}
+
+        def _tokenize(text: str) -> list[int]:
+            if text not in tok_cache:
+                tok_cache[text] = tokenizer.tokenize(text)
+            return tok_cache[text]
+
+        # 依完成順序建立 prompt -> response 的映射，並立即分詞以與其餘請求的網路等待重疊
+        response_map: dict[str, str] = {}
+        token_map: dict[str, list[int]] = {}
+        for next_done in asyncio.as_completed([keyed(p, t) for p, t in tasks.items()]):
+            prompt, ok, result = await next_done
+            if not ok:
+                continue
 
-        # 建立 prompt -> response 的映射
-        response_map = {}
-        for (prompt, _), result in zip(tasks, results, strict=False):
-            if not isinstance(result, Exception):
-                response_map[prompt] = result
+            response_map[prompt] = result
+            if result:
+                token_map[prompt] = _tokenize(result)
 
         # 計算指標
         top1_changes = 0
@@ -88,26 +113,19 @@ class PerturbationDetector(BaseDetector):
         hamming_sum = 0
         failed_samples = len(tasks) - len(response_map)
 
-        for base_prompt in self.BASE_PROMPTS:
+        for base_prompt, perturbed_prompts in perturbations.items():
             base_resp = response_map.get(base_prompt)
             if not base_resp:
                 continue
 
-            base_tokens = tokenizer.tokenize(base_resp)
-
-            # 產生擾動版本（與上面相同）
-            perturbed_prompts = [
-                base_prompt + " ",
-                base_prompt + "\n",
-                self._apply_synonym_replacement(base_prompt),
-            ]
+            base_tokens = token_map[base_prompt]
 
             for pert_prompt in perturbed_prompts:
                 pert_resp = response_map.get(pert_prompt)
                 if not pert_resp:
                     continue
 
-                pert_tokens = tokenizer.tokenize(pert_resp)
+                pert_tokens = token_map[pert_prompt]
 
                 # 比較首 token
                 if base_tokens and pert_tokens:
@@ -115,7 +133,7 @@ class PerturbationDetector(BaseDetector):
                         top1_changes += 1
 
                     # 計算 Hamming 距離（前 10 個 token）
-                    hamming_sum += hamming_distance(base_tokens, pert_tokens, k=10)
+                    hamming_sum += hamming_distance(base_tokens, pert_tokens, k=_PREFIX_TOKENS)
 
                 total_pairs += 1
 
@@ -138,36 +156,59 @@ class PerturbationDetector(BaseDetector):
             name=self.name,
             passed=passed,
             metrics={
-                "top1_change_pct": round(top1_change_pct, 2),
-                "avg_hamming@10": round(avg_hamming, 2),
+                "top1_change_pct": q2(top1_change_pct),
+                "avg_hamming@10": q2(avg_hamming),
                 "pairs": total_pairs,
                 "failed_samples": failed_samples,
-                "success_rate": round(success_rate, 2),
+                "success_rate": q2(success_rate),
                 "threshold": thresholds.perturb_top1_change_pct,
             },
             notes=notes,
         )
 
     async def _call_api(
-        self, api: OpenAICompatibleAPI, prompt: str, decoding: DecodingConfig
+        self,
+        api: OpenAICompatibleAPI,
+        tokenizer: Tokenizer,
+        prompt: str,
+        decoding: DecodingConfig,
     ) -> str:
-        """呼叫 API 並回傳回應內容。
+        """以串流呼叫 API，僅讀取比較所需的回應前綴。
+
+        指標只使用前 10 個 token，讀到超過該數量即中止串流，不必等待完整回應；
+        為避免每個片段都重新分詞，僅在累積文字長度加倍時檢查 token 數。
 
         Args:
             api: API 客戶端
+            tokenizer: 分詞器
             prompt: 提示文字
             decoding: 解碼參數
 
         Returns:
-            API 回應的文字內容
+            API 回應的文字前綴（回應較短時為完整內容）
         """
-        messages = [{"role": "user", "content": prompt}]
-        response = await api.generate(
-            messages=messages, temperature=decoding.temperature, max_tokens=decoding.max_tokens
+        stream = api.generate_user_stream(
+            prompt, temperature=decoding.temperature, max_tokens=decoding.max_tokens
         )
-        return response.choices[0].message.content
-
-    def _apply_synonym_replacement(self, text: str) -> str:
+        text = ""
+        # 下次檢查 token 數的文字長度
+        next_check = 0
+        try:
+            async for delta in stream:
+                text += delta
+                if len(text) < next_check:
+                    continue
+                # 多讀一個 token，避免截斷處的最後一個 token 與完整回應的分詞不同
+                if len(tokenizer.tokenize(text)) > _PREFIX_TOKENS:
+                    break
+                next_check = 2 * len(text)
+        finally:
+            await stream.aclose()
+        return text
+
+    @staticmethod
+    @functools.cache
+    def _apply_synonym_replacement(text: str) -> str:
         """應用簡單的同義替換。
 
         Args:
@@ -176,11 +217,4 @@ class PerturbationDetector(BaseDetector):
         Returns:
             替換後的文字
         """
-        # 簡單的同義詞替換規則
-        replacements = {"three": "3", "三個": "3個", "one": "1", "一句話": "1句話"}
-
-        result = text
-        for old, new in replacements.items():
-            result = result.replace(old, new)
-
-        return result
+        return _SYN_RE.sub(lambda m: _SYN_MAP[m.group(0)], text)
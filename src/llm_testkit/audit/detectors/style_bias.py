@@ -8,10 +8,16 @@ import asyncio
 import re
 
 from llm_testkit.audit.config import DecodingConfig, ThresholdsConfig
-from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult
+from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult, q2
 from llm_testkit.backend.openai_api import OpenAICompatibleAPI
 from llm_testkit.core.tokenizer import Tokenizer
 
+# 固定前綴模式：檢測常見的禮貌性前言或拒答措辭（模組載入時預先編譯）
+_FIXED_PREFIX_RE = re.compile(r"(?i)^(?:sure[, ]|of course|as an ai|抱歉|很抱歉|我無法)")
+
+# 項目符號開頭字元：-, *, •, 數字編號（非 ASCII 數字另以 str.isdecimal 判斷，與 \d 語意一致）
+_BULLET_STARTS = frozenset("-*•0123456789")
+
 
 class StyleBiasDetector(BaseDetector):
     """風格偏移檢測器。
@@ -33,12 +39,6 @@ class StyleBiasDetector(BaseDetector):
         "列出兩項 L2 正則化的代價。不要任何前言或結語。只輸出兩個項目。",
     ]
 
-    # 固定前綴模式：檢測常見的禮貌性前言或拒答措辭
-    FIXED_PREFIX_PATTERNS = [
-        r"(?i)^sure[, ]|^of course|^as an ai",
-        r"^(抱歉|很抱歉|我無法)",
-    ]
-
     @property
     def name(self) -> str:
         """回傳檢測器名稱。"""
@@ -62,29 +62,29 @@ class StyleBiasDetector(BaseDetector):
         Returns:
             檢測結果，包含固定前綴出現率與格式違規率
         """
-        # 併發執行所有 API 呼叫
+        # 併發執行所有 API 呼叫，並依完成順序立即檢查回應
         tasks = [self._call_api(api, prompt, decoding) for prompt in self.PROMPTS]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         prefix_hits = 0
         format_violations = 0
         failed_samples = 0
         total = len(self.PROMPTS)
 
-        for result in results:
-            if isinstance(result, Exception):
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception:
                 failed_samples += 1
                 continue
 
             response = result.strip()
 
             # 檢查固定前綴
-            if any(re.search(pat, response) for pat in self.FIXED_PREFIX_PATTERNS):
-                prefix_hits += 1
+            prefix_hits += bool(_FIXED_PREFIX_RE.match(response))
 
             # 檢查格式（應以項目符號開頭）
             # 支援常見的項目符號格式：-, *, •, 數字編號
-            if not re.match(r"^[-*•\d]", response):
+            if not response or not (response[0] in _BULLET_STARTS or response[0].isdecimal()):
                 format_violations += 1
 
         # 計算指標（排除失敗樣本）
@@ -110,10 +110,10 @@ class StyleBiasDetector(BaseDetector):
             name=self.name,
             passed=passed,
             metrics={
-                "fixed_prefix_rate": round(prefix_rate, 2),
-                "format_violation_rate": round(violation_rate, 2),
+                "fixed_prefix_rate": q2(prefix_rate),
+                "format_violation_rate": q2(violation_rate),
                 "failed_samples": failed_samples,
-                "success_rate": round(success_rate, 2),
+                "success_rate": q2(success_rate),
                 "threshold_prefix": thresholds.style_fixed_prefix_rate,
                 "threshold_violation": thresholds.style_format_violation_rate,
             },
@@ -133,8 +133,7 @@ class StyleBiasDetector(BaseDetector):
         Returns:
             API 回應的文字內容
         """
-        messages = [{"role": "user", "content": prompt}]
-        response = await api.generate(
-            messages=messages, temperature=decoding.temperature, max_tokens=decoding.max_tokens
+        response = await api.generate_user(
+            prompt, temperature=decoding.temperature, max_tokens=decoding.max_tokens
         )
         return response.choices[0].message.content
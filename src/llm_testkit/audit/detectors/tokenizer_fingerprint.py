@@ -5,12 +5,21 @@
 """
 
 import asyncio
+import unicodedata
 
 from llm_testkit.audit.config import DecodingConfig, ThresholdsConfig
-from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult
+from llm_testkit.audit.detectors.base import BaseDetector, DetectorResult, keyed, q2
 from llm_testkit.backend.openai_api import OpenAICompatibleAPI
 from llm_testkit.core.tokenizer import Tokenizer
 
+# 測試字串原始定義：涵蓋空白、ZWJ、Emoji、URL、CJK 混排等邊界情況
+_RAW_STRINGS = (
+    "a a  a\n\n🙂http://例.com/路径?x=1#锚",
+    "A" + (" " * 64) + "👨‍👩‍👦‍👦",
+    "零寬連字元：a\u200db",
+    "Emoji ZWJ: 👩\u200d💻👨\u200d👩\u200d👧\u200d👦",
+)
+
 
 class TokenizerFingerprintDetector(BaseDetector):
     """分詞器指紋檢測器。
@@ -25,13 +34,12 @@ class TokenizerFingerprintDetector(BaseDetector):
     4. 若平均偏差超過閾值，標記為「高度懷疑非該家族」
     """
 
-    # 測試字串集：涵蓋空白、ZWJ、Emoji、URL、CJK 混排等邊界情況
-    FINGERPRINT_STRINGS = [
-        "a a  a\n\n🙂http://例.com/路径?x=1#锚",
-        "A" + (" " * 64) + "👨‍👩‍👦‍👦",
-        "零寬連字元：a\u200db",
-        "Emoji ZWJ: 👩\u200d💻👨\u200d👩\u200d👧\u200d👦",
-    ]
+    # 測試字串集：於載入時統一正規化為 NFC，確保本地與遠端計數的輸入位元組一致。
+    # 新增字串請加入 _RAW_STRINGS，勿直接修改此處以免引入未正規化的形式。
+    FINGERPRINT_STRINGS = tuple(unicodedata.normalize("NFC", s) for s in _RAW_STRINGS)
+
+    # 實際送出的提示：於類別載入時建立一次
+    PROMPTS = tuple(f"請原樣回傳以下文字：\n{test_str}" for test_str in FINGERPRINT_STRINGS)
 
     @property
     def name(self) -> str:
@@ -56,28 +64,40 @@ class TokenizerFingerprintDetector(BaseDetector):
         Returns:
             檢測結果，包含平均偏差百分比與樣本數
         """
-        # 本地計算所有 token 數
-        prompts = [f"請原樣回傳以下文字：\n{test_str}" for test_str in self.FINGERPRINT_STRINGS]
-        local_counts = [tokenizer.count(prompt) for prompt in prompts]
-
-        # 併發執行所有 API 呼叫
-        tasks = []
-        for prompt in prompts:
-            messages = [{"role": "user", "content": prompt}]
-            task = api.generate(
-                messages=messages, temperature=decoding.temperature, max_tokens=decoding.max_tokens
+        # 本地批次計算所有 token 數（分詞器自身會快取已計算過的文字）
+        prompts = self.PROMPTS
+        local_counts = tokenizer.count_batch(prompts)
+
+        # 合併請求模式：以實測的模板開銷比對總 token 數，未能確認通過時退回逐筆請求
+        if decoding.row_marshal_fingerprint:
+            result = await self._run_row_marshal(api, local_counts, decoding, thresholds)
+            if result is not None:
+                return result
+
+        # 併發執行所有 API 呼叫，以索引標記以便對應本地 token 數
+        tasks = [
+            asyncio.create_task(
+                keyed(
+                    idx,
+                    api.generate_user(
+                        prompt, temperature=decoding.temperature, max_tokens=decoding.max_tokens
+                    ),
+                )
             )
-            tasks.append(task)
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            for idx, prompt in enumerate(prompts)
+        ]
 
         diffs = []
         max_diff = 0.0
         failed_samples = 0
         no_usage_count = 0
+        skipped_samples = 0
+        threshold = thresholds.fingerprint_avg_diff_pct
 
-        for local_count, result in zip(local_counts, results, strict=False):
-            if isinstance(result, Exception):
+        # 依完成順序累計偏差
+        for done_count, next_done in enumerate(asyncio.as_completed(tasks), 1):
+            idx, ok, result = await next_done
+            if not ok:
                 failed_samples += 1
                 continue
 
@@ -92,13 +112,28 @@ class TokenizerFingerprintDetector(BaseDetector):
                 continue
 
             # 計算偏差百分比
+            local_count = local_counts[idx]
             diff_pct = abs(local_count - remote_count) / max(1, local_count) * 100
             diffs.append(diff_pct)
             max_diff = max(max_diff, diff_pct)
 
+            # 即使剩餘樣本偏差皆為 0 平均仍超過閾值時，結果已確定為失敗，取消剩餘請求
+            remaining = len(tasks) - done_count
+            if remaining and sum(diffs) / (len(diffs) + remaining) > threshold:
+                skipped_samples = remaining
+                break
+
+        early_exit = skipped_samples > 0
+        if early_exit:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
         # 計算平均偏差
         avg_diff = sum(diffs) / len(diffs) if diffs else None
-        success_rate = len(diffs) / len(prompts) if prompts else 0.0
+        # 成功率只計算實際送出的樣本，提前結束而略過的樣本不算失敗
+        attempted = len(prompts) - skipped_samples
+        success_rate = len(diffs) / attempted if attempted else 0.0
 
         # 判定通過條件：有 usage 資訊且平均偏差在閾值內
         if avg_diff is None:
@@ -108,21 +143,103 @@ class TokenizerFingerprintDetector(BaseDetector):
             else:
                 notes = f"所有請求失敗（{failed_samples} 個樣本）"
         else:
-            passed = avg_diff <= thresholds.fingerprint_avg_diff_pct
+            passed = avg_diff <= threshold
             notes = ""
             if failed_samples > 0:
                 notes = f"警告：{failed_samples} 個樣本請求失敗"
+            if early_exit:
+                skipped = f"偏差已確定超過閾值，略過剩餘 {skipped_samples} 個樣本"
+                notes = f"{notes}; {skipped}" if notes else skipped
 
         return DetectorResult(
             name=self.name,
             passed=passed,
             metrics={
-                "avg_token_diff_pct": round(avg_diff, 2) if avg_diff is not None else None,
-                "max_token_diff_pct": round(max_diff, 2) if diffs else None,
+                "avg_token_diff_pct": q2(avg_diff),
+                "max_token_diff_pct": q2(max_diff) if diffs else None,
                 "samples": len(diffs),
                 "failed_samples": failed_samples,
-                "success_rate": round(success_rate, 2),
-                "threshold": thresholds.fingerprint_avg_diff_pct,
+                "skipped_samples": skipped_samples,
+                "success_rate": q2(success_rate),
+                "threshold": threshold,
+                "early_exit": early_exit,
             },
             notes=notes,
         )
+
+    async def _run_row_marshal(
+        self,
+        api: OpenAICompatibleAPI,
+        local_counts: list[int],
+        decoding: DecodingConfig,
+        thresholds: ThresholdsConfig,
+    ) -> DetectorResult | None:
+        """以合併請求（多個 user 訊息）執行分詞器指紋檢測。
+
+        遠端 prompt_tokens 視為「每請求固定開銷 F + 每則訊息開銷 T + 內容 token 數」。
+        以同一提示的單則與兩則訊息請求實測 F（= 2·R1 − R2，內容與 T 相互抵銷），
+        再由合併請求 RN 推算逐筆請求的遠端總數 RN + (N − 1)·F，與本地總數比對。
+        如此偏差與逐筆模式同樣包含模板開銷。逐筆模式以各提示偏差百分比的平均判定，
+        總數只能給出其上限（各提示偏差同向時，平均不超過總偏差 ÷ (N × 最短提示 token 數)），
+        因此僅在此上限不超過閾值時採用合併結果，其餘交由逐筆請求判定。
+
+        Args:
+            api: API 客戶端
+            local_counts: 各提示的本地 token 數
+            decoding: 解碼參數
+            thresholds: 閾值配置
+
+        Returns:
+            通過時的檢測結果；請求失敗、無 usage 資訊、開銷不符模型或偏差超過閾值時
+            回傳 None，由逐筆請求判定
+        """
+        first = self.PROMPTS[0]
+        params = {"temperature": decoding.temperature, "max_tokens": decoding.max_tokens}
+        requests = (
+            api.generate_user(first, **params),
+            api.generate(messages=[{"role": "user", "content": first}] * 2, **params),
+            api.generate(
+                messages=[{"role": "user", "content": prompt} for prompt in self.PROMPTS],
+                **params,
+            ),
+        )
+
+        counts = []
+        for _, ok, response in await asyncio.gather(*(keyed(i, r) for i, r in enumerate(requests))):
+            usage = getattr(response, "usage", None) if ok else None
+            if usage is None or usage.prompt_tokens is None:
+                return None
+            counts.append(usage.prompt_tokens)
+        single, double, marshalled = counts
+
+        # 每請求固定開銷；為負代表模板不符合上述模型
+        request_overhead = 2 * single - double
+        if request_overhead < 0:
+            return None
+
+        expected = sum(local_counts)
+        remote = marshalled + (len(local_counts) - 1) * request_overhead
+        diff = abs(expected - remote)
+        diff_pct = diff / max(1, expected) * 100
+        # 逐筆平均偏差的上限；超過閾值時無法確認通過，失敗判定一律交由逐筆請求
+        avg_bound_pct = diff / max(1, len(local_counts) * min(local_counts)) * 100
+        threshold = thresholds.fingerprint_avg_diff_pct
+        if avg_bound_pct > threshold:
+            return None
+
+        return DetectorResult(
+            name=self.name,
+            passed=True,
+            metrics={
+                "avg_token_diff_pct": q2(diff_pct),
+                "max_token_diff_pct": None,
+                "samples": len(local_counts),
+                "failed_samples": 0,
+                "skipped_samples": 0,
+                "success_rate": 1.0,
+                "threshold": threshold,
+                "early_exit": False,
+                "row_marshal": True,
+                "request_overhead_tokens": request_overhead,
+            },
+        )
@@ -3,23 +3,102 @@
 提供審計系統的核心執行邏輯，協調 API 客戶端、分詞器與檢測器。
 """
 
+import asyncio
+import importlib
+import operator
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
+from typing import Any, NamedTuple
 
 from llm_testkit.audit.config import AuditConfig
-from llm_testkit.audit.detectors import (
-    ArithmeticJsonDetector,
-    BaseDetector,
-    DetectorResult,
-    PerturbationDetector,
-    StyleBiasDetector,
-    TokenizerFingerprintDetector,
-)
-from llm_testkit.backend.openai_api import OpenAICompatibleAPI
+from llm_testkit.audit.detectors import BaseDetector, DetectorResult
+from llm_testkit.backend.openai_api import CoalescingAPI, OpenAICompatibleAPI
 from llm_testkit.core.tokenizer import Tokenizer
+from llm_testkit.core.tokenizer_diskcache import TokenCountDiskCache
 from llm_testkit.utils.io import write_json
 from llm_testkit.utils.logging import setup_logger
 
+# 終端輸出分隔線與狀態圖示
+_SEP = "=" * 70
+STATUS_PASS_ICON = "✅"
+STATUS_FAIL_ICON = "❌"
+
+# 檢測器名稱 -> (模組路徑, 類別名稱)，僅在套件實際使用時才載入並實例化
+_DETECTOR_PATHS = {
+    "tokenizer_fingerprint": (
+        "llm_testkit.audit.detectors.tokenizer_fingerprint",
+        "TokenizerFingerprintDetector",
+    ),
+    "perturbation": ("llm_testkit.audit.detectors.perturbation", "PerturbationDetector"),
+    "arithmetic_json": ("llm_testkit.audit.detectors.arithmetic_json", "ArithmeticJsonDetector"),
+    "style_bias": ("llm_testkit.audit.detectors.style_bias", "StyleBiasDetector"),
+}
+
+# 檢測器名稱 -> 報告中文標題
+_DETECTOR_TITLES = {
+    "tokenizer_fingerprint": "分詞器指紋檢測",
+    "perturbation": "微擾穩定性檢測",
+    "arithmetic_json": "算術與 JSON 結構完整性檢測",
+    "style_bias": "風格偏移檢測",
+}
+
+
+class MetricSpec(NamedTuple):
+    """Markdown 報告中單一指標列的定義。
+
+    Attributes:
+        label: 指標顯示名稱
+        key: 指標鍵；多個鍵時數值以 "/" 連接
+        threshold_key: 閾值所在的指標鍵
+        threshold: 固定閾值（未指定 threshold_key 時使用）
+        compare: 判定通過的比較函式；None 表示僅列出數值
+        unit: 數值與閾值的單位後綴
+        fmt: 數值格式（format spec）
+        default: 指標缺失時的預設值；None 表示略過該列
+    """
+
+    label: str
+    key: str | tuple[str, ...]
+    threshold_key: str | None = None
+    threshold: Any = None
+    compare: Callable[[Any, Any], bool] | None = None
+    unit: str = ""
+    fmt: str = ""
+    default: Any = None
+
+
+# 比較函式 -> 閾值欄位的符號前綴
+_COMPARE_SYMBOLS = {operator.le: "≤ ", operator.ge: "≥ ", operator.eq: ""}
+
+# 檢測器名稱 -> Markdown 指標表格定義
+_METRIC_SCHEMA: dict[str, tuple[MetricSpec, ...]] = {
+    "tokenizer_fingerprint": (
+        MetricSpec("平均 token 偏差", "avg_token_diff_pct", "threshold", None, operator.le, "%"),
+        MetricSpec("最大 token 偏差", "max_token_diff_pct", unit="%"),
+        MetricSpec("測試樣本數", "samples", default=0),
+        MetricSpec("略過樣本數", "skipped_samples", default=0),
+        MetricSpec("成功率", "success_rate", fmt=".0%", default=0),
+    ),
+    "perturbation": (
+        MetricSpec("Top-1 變更率", "top1_change_pct", "threshold", None, operator.le, "%"),
+        MetricSpec("平均 Hamming 距離 (前10 token)", "avg_hamming@10"),
+        MetricSpec("測試對數", "pairs", default=0),
+        MetricSpec("成功率", "success_rate", fmt=".0%", default=0),
+    ),
+    "arithmetic_json": (
+        MetricSpec("算術正確率", "arithmetic_acc", "threshold_arithmetic", None, operator.ge),
+        MetricSpec("算術測試 (正確/總數)", ("arithmetic_correct", "arithmetic_total"), default=0),
+        MetricSpec("JSON 合法性", "json_valid_sample", None, True, operator.eq),
+        MetricSpec("成功率", "arithmetic_success_rate", fmt=".0%", default=0),
+    ),
+    "style_bias": (
+        MetricSpec("固定前綴出現率", "fixed_prefix_rate", "threshold_prefix", None, operator.le),
+        MetricSpec("格式違規率", "format_violation_rate", "threshold_violation", None, operator.le),
+        MetricSpec("成功率", "success_rate", fmt=".0%", default=0),
+    ),
+}
+
 
 class AuditRunner:
     """審計執行器。
@@ -31,7 +110,8 @@ class AuditRunner:
         logger: 日誌記錄器
         api: API 客戶端
         tokenizer: 分詞器
-        detectors: 檢測器註冊表
+        token_cache: token 數磁碟快取（未啟用時為 None）
+        detectors: 已實例化的檢測器（首次使用時建立）
     """
 
     def __init__(self, config: AuditConfig):
@@ -49,32 +129,49 @@ class AuditRunner:
             model_name=config.endpoint.model,
             base_url=config.endpoint.url,
             api_key=config.endpoint.api_key,
+            http2=not config.endpoint.disable_http2,
         )
+        if config.run.coalesce:
+            # 合併各檢測器間相同的確定性請求（temperature == 0）
+            self.api = CoalescingAPI(self.api)
 
         # 初始化分詞器
         self.logger.info(f"初始化分詞器: {config.tokenizer.model_name_or_path}")
-        self.tokenizer = Tokenizer(model_name_or_path=config.tokenizer.model_name_or_path)
-
-        # 註冊檢測器
-        self.detectors: dict[str, BaseDetector] = {
-            "tokenizer_fingerprint": TokenizerFingerprintDetector(),
-            "perturbation": PerturbationDetector(),
-            "arithmetic_json": ArithmeticJsonDetector(),
-            "style_bias": StyleBiasDetector(),
-        }
+        self.token_cache = TokenCountDiskCache() if config.tokenizer.disk_cache else None
+        self.tokenizer = Tokenizer(
+            model_name_or_path=config.tokenizer.model_name_or_path, disk_cache=self.token_cache
+        )
 
-        self.logger.info(f"已註冊 {len(self.detectors)} 個檢測器")
+        # 檢測器於 run_suite 中依需求延遲建立
+        self.detectors: dict[str, BaseDetector] = {}
 
-    async def run_suite(self, suite_name: str) -> list[DetectorResult]:
-        """執行測試套件。
+        self.logger.info(f"已註冊 {len(_DETECTOR_PATHS)} 個檢測器")
 
-        依序執行套件中的所有檢測器，單一檢測器失敗不影響其他檢測器。
+        # 報告分派表：依檢測器名稱選擇摘要與解讀的處理函式
+        self._summary_printers: dict[str, Callable[[DetectorResult], None]] = {
+            "tokenizer_fingerprint": self._summary_fingerprint,
+            "perturbation": self._summary_perturbation,
+            "arithmetic_json": self._summary_arithmetic,
+            "style_bias": self._summary_style,
+        }
+        self._interpreters: dict[str, Callable[[DetectorResult], str]] = {
+            "tokenizer_fingerprint": self._interpret_fingerprint,
+            "perturbation": self._interpret_perturbation,
+            "arithmetic_json": self._interpret_arithmetic,
+            "style_bias": self._interpret_style,
+        }
+
+    async def run_suite(self, suite_name: str) -> AsyncIterator[DetectorResult]:
+        """執行測試套件，依完成順序逐一產出檢測結果。
+
+        併發執行套件中的所有檢測器，單一檢測器失敗不影響其他檢測器。
+        提前結束迭代時會取消尚未完成的檢測器。
 
         Args:
             suite_name: 套件名稱（如 "quick"）
 
-        Returns:
-            檢測結果列表
+        Yields:
+            檢測結果（依完成順序）
 
         Raises:
             ValueError: 套件名稱不存在
@@ -84,40 +181,55 @@ class AuditRunner:
             raise ValueError(f"測試套件 '{suite_name}' 不存在。可用套件: {available}")
 
         detector_names = self.config.suites[suite_name]
-        results = []
+        total = len(detector_names)
 
-        print(f"\n{'=' * 70}")
+        print(f"\n{_SEP}")
         print(f"開始執行測試套件: {suite_name}")
-        print(f"包含 {len(detector_names)} 個檢測器")
-        print(f"{'=' * 70}\n")
+        print(f"包含 {total} 個檢測器")
+        print(f"{_SEP}\n")
+
+        # 檢測器併發執行，同時執行數以 run.parallel 為上限（預設 1 即依序執行），
+        # 並以鎖確保單一檢測器的輸出不被交錯
+        sem = asyncio.Semaphore(self.config.run.parallel)
+        print_lock = asyncio.Lock()
 
-        for idx, name in enumerate(detector_names, 1):
-            detector = self.detectors.get(name)
+        async def _one(idx: int, name: str) -> DetectorResult:
+            detector = self._get_detector(name)
 
             if not detector:
-                print(f"[{idx}/{len(detector_names)}] ⚠️  檢測器 '{name}' 不存在，跳過")
-                results.append(
-                    DetectorResult(
-                        name=name, passed=False, metrics={}, notes=f"檢測器 '{name}' 未註冊"
-                    )
+                async with print_lock:
+                    print(f"[{idx}/{total}] ⚠️  檢測器 '{name}' 不存在，跳過")
+                return DetectorResult(
+                    name=name, passed=False, metrics={}, notes=f"檢測器 '{name}' 未註冊"
                 )
-                continue
 
-            print(f"[{idx}/{len(detector_names)}] 🔄 執行檢測器: {name}")
+            async with sem:
+                async with print_lock:
+                    print(f"[{idx}/{total}] 🔄 執行檢測器: {name}")
 
-            try:
-                result = await detector.run(
-                    api=self.api,
-                    tokenizer=self.tokenizer,
-                    decoding=self.config.decoding,
-                    thresholds=self.config.thresholds,
-                )
-                results.append(result)
+                try:
+                    result = await detector.run(
+                        api=self.api,
+                        tokenizer=self.tokenizer,
+                        decoding=self.config.decoding,
+                        thresholds=self.config.thresholds,
+                    )
 
+                except Exception as e:
+                    async with print_lock:
+                        print(f"[{idx}/{total}] {STATUS_FAIL_ICON} {name}: 執行錯誤")
+                        print(f"     錯誤: {str(e)}")
+                        print()
+                    self.logger.error(f"檢測器 '{name}' 執行失敗: {e}", exc_info=True)
+                    return DetectorResult(
+                        name=name, passed=False, metrics={}, notes=f"執行錯誤: {str(e)}"
+                    )
+
+            async with print_lock:
                 # 顯示結果
-                status_icon = "✅" if result.passed else "❌"
+                status_icon = STATUS_PASS_ICON if result.passed else STATUS_FAIL_ICON
                 status_text = "通過" if result.passed else "失敗"
-                print(f"[{idx}/{len(detector_names)}] {status_icon} {name}: {status_text}")
+                print(f"[{idx}/{total}] {status_icon} {name}: {status_text}")
 
                 # 顯示關鍵指標
                 self._print_metrics_summary(result)
@@ -127,25 +239,59 @@ class AuditRunner:
 
                 print()  # 空行分隔
 
-            except Exception as e:
-                print(f"[{idx}/{len(detector_names)}] ❌ {name}: 執行錯誤")
-                print(f"     錯誤: {str(e)}")
-                print()
-                self.logger.error(f"檢測器 '{name}' 執行失敗: {e}", exc_info=True)
-                results.append(
-                    DetectorResult(name=name, passed=False, metrics={}, notes=f"執行錯誤: {str(e)}")
-                )
+            return result
 
-        # 統計結果
-        passed_count = sum(1 for r in results if r.passed)
-        total_count = len(results)
+        tasks = [asyncio.create_task(_one(idx, name)) for idx, name in enumerate(detector_names, 1)]
+
+        # 依完成順序產出結果並統計
+        passed_count = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                passed_count += result.passed
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        print(_SEP)
+        print(f"測試套件完成: {passed_count}/{total} 通過")
+        print(f"{_SEP}\n")
+
+    async def run_suite_list(self, suite_name: str) -> list[DetectorResult]:
+        """執行測試套件並收集所有檢測結果。
 
-        print(f"{'=' * 70}")
-        print(f"測試套件完成: {passed_count}/{total_count} 通過")
-        print(f"{'=' * 70}\n")
+        Args:
+            suite_name: 套件名稱（如 "quick"）
+
+        Returns:
+            檢測結果列表（順序與套件定義一致）
 
+        Raises:
+            ValueError: 套件名稱不存在
+        """
+        results = [result async for result in self.run_suite(suite_name)]
+        detector_names = self.config.suites[suite_name]
+        results.sort(key=lambda r: detector_names.index(r.name))
         return results
 
+    def _get_detector(self, name: str) -> BaseDetector | None:
+        """取得檢測器實例，首次使用時才導入模組並建立。
+
+        Args:
+            name: 檢測器名稱
+
+        Returns:
+            檢測器實例；名稱未註冊時回傳 None
+        """
+        detector = self.detectors.get(name)
+        if detector is None and name in _DETECTOR_PATHS:
+            module_path, class_name = _DETECTOR_PATHS[name]
+            detector_cls = getattr(importlib.import_module(module_path), class_name)
+            detector = self.detectors[name] = detector_cls()
+        return detector
+
     def _print_metrics_summary(self, result: DetectorResult) -> None:
         """顯示檢測器指標摘要。
 
@@ -153,38 +299,44 @@ class AuditRunner:
             result: 檢測結果
         """
         # 根據檢測器類型顯示關鍵指標
-        if result.name == "tokenizer_fingerprint":
-            avg_diff = result.metrics.get("avg_token_diff_pct")
-            threshold = result.metrics.get("threshold")
-            samples = result.metrics.get("samples", 0)
-            if avg_diff is not None:
-                print(f"     平均偏差: {avg_diff}% (閾值: ≤{threshold}%) | 樣本數: {samples}")
-
-        elif result.name == "perturbation":
-            top1_pct = result.metrics.get("top1_change_pct")
-            threshold = result.metrics.get("threshold")
-            pairs = result.metrics.get("pairs", 0)
-            if top1_pct is not None:
-                print(f"     Top-1 變更率: {top1_pct}% (閾值: ≤{threshold}%) | 測試對數: {pairs}")
-
-        elif result.name == "arithmetic_json":
-            arith_acc = result.metrics.get("arithmetic_acc")
-            json_valid = result.metrics.get("json_valid_sample")
-            threshold = result.metrics.get("threshold_arithmetic")
-            if arith_acc is not None:
-                print(
-                    f"     算術正確率: {arith_acc} (閾值: ≥{threshold}) | JSON 合法: {json_valid}"
-                )
+        printer = self._summary_printers.get(result.name)
+        if printer:
+            printer(result)
 
-        elif result.name == "style_bias":
-            prefix_rate = result.metrics.get("fixed_prefix_rate")
-            violation_rate = result.metrics.get("format_violation_rate")
-            threshold_prefix = result.metrics.get("threshold_prefix")
-            threshold_violation = result.metrics.get("threshold_violation")
-            if prefix_rate is not None:
-                print(
-                    f"     固定前綴率: {prefix_rate} (閾值: ≤{threshold_prefix}) | 格式違規率: {violation_rate} (閾值: ≤{threshold_violation})"
-                )
+    def _summary_fingerprint(self, result: DetectorResult) -> None:
+        """顯示分詞器指紋檢測的指標摘要。"""
+        avg_diff = result.metrics.get("avg_token_diff_pct")
+        threshold = result.metrics.get("threshold")
+        samples = result.metrics.get("samples", 0)
+        if avg_diff is not None:
+            print(f"     平均偏差: {avg_diff}% (閾值: ≤{threshold}%) | 樣本數: {samples}")
+
+    def _summary_perturbation(self, result: DetectorResult) -> None:
+        """顯示微擾穩定性檢測的指標摘要。"""
+        top1_pct = result.metrics.get("top1_change_pct")
+        threshold = result.metrics.get("threshold")
+        pairs = result.metrics.get("pairs", 0)
+        if top1_pct is not None:
+            print(f"     Top-1 變更率: {top1_pct}% (閾值: ≤{threshold}%) | 測試對數: {pairs}")
+
+    def _summary_arithmetic(self, result: DetectorResult) -> None:
+        """顯示算術與 JSON 檢測的指標摘要。"""
+        arith_acc = result.metrics.get("arithmetic_acc")
+        json_valid = result.metrics.get("json_valid_sample")
+        threshold = result.metrics.get("threshold_arithmetic")
+        if arith_acc is not None:
+            print(f"     算術正確率: {arith_acc} (閾值: ≥{threshold}) | JSON 合法: {json_valid}")
+
+    def _summary_style(self, result: DetectorResult) -> None:
+        """顯示風格偏移檢測的指標摘要。"""
+        prefix_rate = result.metrics.get("fixed_prefix_rate")
+        violation_rate = result.metrics.get("format_violation_rate")
+        threshold_prefix = result.metrics.get("threshold_prefix")
+        threshold_violation = result.metrics.get("threshold_violation")
+        if prefix_rate is not None:
+            print(
+                f"     固定前綴率: {prefix_rate} (閾值: ≤{threshold_prefix}) | 格式違規率: {violation_rate} (閾值: ≤{threshold_violation})"
+            )
 
     def generate_report(self, results: list[DetectorResult], output_dir: str | Path) -> None:
         """產生報告。
@@ -211,20 +363,41 @@ class AuditRunner:
         write_json(report_data, json_path)
         self.logger.info(f"JSON 報告已產生: {json_path}")
 
-        # Markdown 報告
-        md_lines = [
-            "# LLM API 審計報告",
-            "",
-            "## 基本資訊",
-            "",
-            f"- **時間戳記:** {timestamp}",
-            f"- **API 端點:** {self.config.endpoint.url}",
-            f"- **模型名稱:** {self.config.endpoint.model}",
-            f"- **分詞器:** {self.config.tokenizer.model_name_or_path}",
-            "",
-            "## 測試摘要",
-            "",
-        ]
+        # Markdown 報告：逐行串流寫入檔案，不在記憶體中組裝完整內容
+        md_path = output_dir / "report.md"
+        with md_path.open("w", encoding="utf-8", buffering=64 * 1024) as f:
+
+            def write(line: str = "") -> None:
+                f.write(line)
+                f.write("\n")
+
+            self._write_markdown(results, timestamp, write)
+
+        self.logger.info(f"Markdown 報告已產生: {md_path}")
+
+        self.logger.info(f"報告已產生至目錄: {output_dir}")
+
+    def _write_markdown(
+        self, results: list[DetectorResult], timestamp: str, write: Callable[[str], None]
+    ) -> None:
+        """逐行輸出 Markdown 報告內容。
+
+        Args:
+            results: 檢測結果列表
+            timestamp: 報告時間戳記
+            write: 寫入單行內容的函式（自動換行）
+        """
+        write("# LLM API 審計報告")
+        write("")
+        write("## 基本資訊")
+        write("")
+        write(f"- **時間戳記:** {timestamp}")
+        write(f"- **API 端點:** {self.config.endpoint.url}")
+        write(f"- **模型名稱:** {self.config.endpoint.model}")
+        write(f"- **分詞器:** {self.config.tokenizer.model_name_or_path}")
+        write("")
+        write("## 測試摘要")
+        write("")
 
         # 統計摘要
         passed_count = sum(1 for r in results if r.passed)
@@ -232,79 +405,60 @@ class AuditRunner:
         pass_rate = (passed_count / total_count * 100) if total_count > 0 else 0
 
         # 整體判定
-        overall_status = "✅ 通過" if passed_count == total_count else "❌ 失敗"
-
-        md_lines.extend(
-            [
-                "| 項目 | 數值 |",
-                "|------|------|",
-                f"| **整體狀態** | {overall_status} |",
-                f"| **總測試數** | {total_count} |",
-                f"| **通過數** | {passed_count} |",
-                f"| **失敗數** | {total_count - passed_count} |",
-                f"| **通過率** | {pass_rate:.1f}% |",
-                "",
-                "## 詳細結果",
-                "",
-            ]
+        overall_status = (
+            f"{STATUS_PASS_ICON} 通過"
+            if passed_count == total_count
+            else f"{STATUS_FAIL_ICON} 失敗"
         )
 
+        write("| 項目 | 數值 |")
+        write("|------|------|")
+        write(f"| **整體狀態** | {overall_status} |")
+        write(f"| **總測試數** | {total_count} |")
+        write(f"| **通過數** | {passed_count} |")
+        write(f"| **失敗數** | {total_count - passed_count} |")
+        write(f"| **通過率** | {pass_rate:.1f}% |")
+        write("")
+        write("## 詳細結果")
+        write("")
+
         # 詳細結果
         for result in results:
-            status_icon = "✅" if result.passed else "❌"
+            status_icon = STATUS_PASS_ICON if result.passed else STATUS_FAIL_ICON
             status_text = "通過" if result.passed else "失敗"
 
             # 檢測器標題
             detector_title = self._get_detector_title(result.name)
-            md_lines.append(f"### {status_icon} {detector_title}")
-            md_lines.append("")
-            md_lines.append(f"**狀態:** {status_text}")
-            md_lines.append("")
+            write(f"### {status_icon} {detector_title}")
+            write("")
+            write(f"**狀態:** {status_text}")
+            write("")
 
             # 指標表格
             if result.metrics:
-                md_lines.append("**指標:**")
-                md_lines.append("")
-
-                # 根據檢測器類型產生不同的表格
-                if result.name == "tokenizer_fingerprint":
-                    md_lines.extend(self._format_fingerprint_metrics(result))
-                elif result.name == "perturbation":
-                    md_lines.extend(self._format_perturbation_metrics(result))
-                elif result.name == "arithmetic_json":
-                    md_lines.extend(self._format_arithmetic_metrics(result))
-                elif result.name == "style_bias":
-                    md_lines.extend(self._format_style_metrics(result))
-                else:
-                    # 預設格式
-                    md_lines.append("| 指標 | 數值 |")
-                    md_lines.append("|------|------|")
-                    for key, value in result.metrics.items():
-                        md_lines.append(f"| {key} | {value} |")
-
-                md_lines.append("")
+                write("**指標:**")
+                write("")
+
+                # 根據檢測器的指標表格定義產生表格
+                self._format_metrics(result, write)
+
+                write("")
 
             # 解讀說明
             interpretation = self._get_interpretation(result)
             if interpretation:
-                md_lines.append("**解讀:**")
-                md_lines.append("")
-                md_lines.append(interpretation)
-                md_lines.append("")
+                write("**解讀:**")
+                write("")
+                write(interpretation)
+                write("")
 
             # 備註
             if result.notes:
-                md_lines.append(f"**備註:** {result.notes}")
-                md_lines.append("")
-
-            md_lines.append("---")
-            md_lines.append("")
-
-        md_path = output_dir / "report.md"
-        md_path.write_text("\n".join(md_lines), encoding="utf-8")
-        self.logger.info(f"Markdown 報告已產生: {md_path}")
+                write(f"**備註:** {result.notes}")
+                write("")
 
-        self.logger.info(f"報告已產生至目錄: {output_dir}")
+            write("---")
+            write("")
 
     def _get_detector_title(self, name: str) -> str:
         """取得檢測器的中文標題。
@@ -315,105 +469,45 @@ class AuditRunner:
         Returns:
             中文標題
         """
-        titles = {
-            "tokenizer_fingerprint": "分詞器指紋檢測",
-            "perturbation": "微擾穩定性檢測",
-            "arithmetic_json": "算術與 JSON 結構完整性檢測",
-            "style_bias": "風格偏移檢測",
-        }
-        return titles.get(name, name)
-
-    def _format_fingerprint_metrics(self, result: DetectorResult) -> list[str]:
-        """格式化分詞器指紋檢測的指標。"""
-        lines = ["| 指標 | 數值 | 閾值 | 狀態 |", "|------|------|------|------|"]
-
-        avg_diff = result.metrics.get("avg_token_diff_pct")
-        threshold = result.metrics.get("threshold")
-        samples = result.metrics.get("samples", 0)
-        success_rate = result.metrics.get("success_rate", 0)
-
-        if avg_diff is not None:
-            status = "✅" if avg_diff <= threshold else "❌"
-            lines.append(f"| 平均 token 偏差 | {avg_diff}% | ≤ {threshold}% | {status} |")
-
-        max_diff = result.metrics.get("max_token_diff_pct")
-        if max_diff is not None:
-            lines.append(f"| 最大 token 偏差 | {max_diff}% | - | - |")
-
-        lines.append(f"| 測試樣本數 | {samples} | - | - |")
-        lines.append(f"| 成功率 | {success_rate * 100:.0f}% | - | - |")
-
-        return lines
-
-    def _format_perturbation_metrics(self, result: DetectorResult) -> list[str]:
-        """格式化微擾穩定性檢測的指標。"""
-        lines = ["| 指標 | 數值 | 閾值 | 狀態 |", "|------|------|------|------|"]
-
-        top1_pct = result.metrics.get("top1_change_pct")
-        threshold = result.metrics.get("threshold")
-        pairs = result.metrics.get("pairs", 0)
-        success_rate = result.metrics.get("success_rate", 0)
-
-        if top1_pct is not None:
-            status = "✅" if top1_pct <= threshold else "❌"
-            lines.append(f"| Top-1 變更率 | {top1_pct}% | ≤ {threshold}% | {status} |")
+        return _DETECTOR_TITLES.get(name, name)
 
-        hamming = result.metrics.get("avg_hamming@10")
-        if hamming is not None:
-            lines.append(f"| 平均 Hamming 距離 (前10 token) | {hamming} | - | - |")
+    def _format_metrics(self, result: DetectorResult, write: Callable[[str], None]) -> None:
+        """依檢測器的指標表格定義輸出 Markdown 指標表格。
 
-        lines.append(f"| 測試對數 | {pairs} | - | - |")
-        lines.append(f"| 成功率 | {success_rate * 100:.0f}% | - | - |")
+        未定義表格的檢測器以預設格式列出所有指標。
 
-        return lines
-
-    def _format_arithmetic_metrics(self, result: DetectorResult) -> list[str]:
-        """格式化算術與 JSON 檢測的指標。"""
-        lines = ["| 指標 | 數值 | 閾值 | 狀態 |", "|------|------|------|------|"]
-
-        arith_acc = result.metrics.get("arithmetic_acc")
-        threshold_arith = result.metrics.get("threshold_arithmetic")
-
-        if arith_acc is not None:
-            status = "✅" if arith_acc >= threshold_arith else "❌"
-            lines.append(f"| 算術正確率 | {arith_acc} | ≥ {threshold_arith} | {status} |")
-
-        correct = result.metrics.get("arithmetic_correct", 0)
-        total = result.metrics.get("arithmetic_total", 0)
-        lines.append(f"| 算術測試 (正確/總數) | {correct}/{total} | - | - |")
-
-        json_valid = result.metrics.get("json_valid_sample")
-        if json_valid is not None:
-            status = "✅" if json_valid else "❌"
-            lines.append(f"| JSON 合法性 | {json_valid} | True | {status} |")
-
-        success_rate = result.metrics.get("arithmetic_success_rate", 0)
-        lines.append(f"| 成功率 | {success_rate * 100:.0f}% | - | - |")
-
-        return lines
-
-    def _format_style_metrics(self, result: DetectorResult) -> list[str]:
-        """格式化風格偏移檢測的指標。"""
-        lines = ["| 指標 | 數值 | 閾值 | 狀態 |", "|------|------|------|------|"]
-
-        prefix_rate = result.metrics.get("fixed_prefix_rate")
-        threshold_prefix = result.metrics.get("threshold_prefix")
-
-        if prefix_rate is not None:
-            status = "✅" if prefix_rate <= threshold_prefix else "❌"
-            lines.append(f"| 固定前綴出現率 | {prefix_rate} | ≤ {threshold_prefix} | {status} |")
-
-        violation_rate = result.metrics.get("format_violation_rate")
-        threshold_violation = result.metrics.get("threshold_violation")
-
-        if violation_rate is not None:
-            status = "✅" if violation_rate <= threshold_violation else "❌"
-            lines.append(f"| 格式違規率 | {violation_rate} | ≤ {threshold_violation} | {status} |")
+        Args:
+            result: 檢測結果
+            write: 寫入單行內容的函式
+        """
+        schema = _METRIC_SCHEMA.get(result.name)
+        if schema is None:
+            write("| 指標 | 數值 |")
+            write("|------|------|")
+            for key, value in result.metrics.items():
+                write(f"| {key} | {value} |")
+            return
+
+        write("| 指標 | 數值 | 閾值 | 狀態 |")
+        write("|------|------|------|------|")
+
+        metrics = result.metrics
+        for spec in schema:
+            keys = (spec.key,) if isinstance(spec.key, str) else spec.key
+            values = [metrics.get(key, spec.default) for key in keys]
+            if None in values:
+                continue
+            value_text = "/".join(format(value, spec.fmt) for value in values) + spec.unit
 
-        success_rate = result.metrics.get("success_rate", 0)
-        lines.append(f"| 成功率 | {success_rate * 100:.0f}% | - | - |")
+            if spec.compare is None:
+                write(f"| {spec.label} | {value_text} | - | - |")
+                continue
 
-        return lines
+            threshold = metrics.get(spec.threshold_key) if spec.threshold_key else spec.threshold
+            passed = spec.compare(values[0], threshold)
+            status = STATUS_PASS_ICON if passed else STATUS_FAIL_ICON
+            threshold_text = f"{_COMPARE_SYMBOLS[spec.compare]}{threshold}{spec.unit}"
+            write(f"| {spec.label} | {value_text} | {threshold_text} | {status} |")
 
     def _get_interpretation(self, result: DetectorResult) -> str:
         """取得檢測結果的解讀說明。
@@ -424,63 +518,70 @@ class AuditRunner:
         Returns:
             解讀說明文字
         """
-        if result.name == "tokenizer_fingerprint":
-            avg_diff = result.metrics.get("avg_token_diff_pct")
-            if avg_diff is None:
-                return "無法取得 token 數量資訊，可能是 API 不支援或網路問題。"
-            elif result.passed:
-                return f"平均 token 數偏差為 {avg_diff}%，在可接受範圍內，表示 API 使用的分詞器與宣稱的模型家族一致。"
-            else:
-                return f"平均 token 數偏差為 {avg_diff}%，超過閾值，可能表示 API 使用了不同的分詞器或模型家族。"
-
-        elif result.name == "perturbation":
-            top1_pct = result.metrics.get("top1_change_pct")
-            if top1_pct is None:
-                return "無法完成微擾測試，可能是 API 請求失敗。"
-            elif result.passed:
-                return f"Top-1 token 變更率為 {top1_pct}%，在可接受範圍內，表示模型在微小輸入擾動下保持穩定，未檢測到明顯的量化影響。"
-            else:
-                return f"Top-1 token 變更率為 {top1_pct}%，超過閾值，可能表示模型使用了低比特量化或解碼核不穩定。"
-
-        elif result.name == "arithmetic_json":
-            arith_acc = result.metrics.get("arithmetic_acc")
-            json_valid = result.metrics.get("json_valid_sample")
-            if arith_acc is None:
-                return "無法完成算術測試，可能是 API 請求失敗。"
-            elif result.passed:
-                return f"算術正確率為 {arith_acc}，JSON 輸出合法，表示模型在精確任務上表現良好，未檢測到明顯的量化影響。"
-            else:
-                issues = []
-                threshold = result.metrics.get("threshold_arithmetic", 0.9)
-                if arith_acc < threshold:
-                    issues.append(f"算術正確率 ({arith_acc}) 低於閾值 ({threshold})")
-                if not json_valid:
-                    issues.append("JSON 輸出不合法")
-                return f"檢測到問題：{', '.join(issues)}。可能表示模型使用了量化或存在強制後處理。"
-
-        elif result.name == "style_bias":
-            prefix_rate = result.metrics.get("fixed_prefix_rate")
-            violation_rate = result.metrics.get("format_violation_rate")
-            if prefix_rate is None:
-                return "無法完成風格測試，可能是 API 請求失敗。"
-            elif result.passed:
-                return f"固定前綴出現率為 {prefix_rate}，格式違規率為 {violation_rate}，均在可接受範圍內，未檢測到明顯的微調影響。"
-            else:
-                issues = []
-                threshold_prefix = result.metrics.get("threshold_prefix", 0.2)
-                threshold_violation = result.metrics.get("threshold_violation", 0.1)
-                if prefix_rate > threshold_prefix:
-                    issues.append(f"固定前綴出現率 ({prefix_rate}) 超過閾值 ({threshold_prefix})")
-                if violation_rate > threshold_violation:
-                    issues.append(f"格式違規率 ({violation_rate}) 超過閾值 ({threshold_violation})")
-                return f"檢測到問題：{', '.join(issues)}。可能表示模型經過微調，導致行為偏移。"
-
-        return ""
+        interpreter = self._interpreters.get(result.name)
+        return interpreter(result) if interpreter else ""
+
+    def _interpret_fingerprint(self, result: DetectorResult) -> str:
+        """取得分詞器指紋檢測結果的解讀說明。"""
+        avg_diff = result.metrics.get("avg_token_diff_pct")
+        if avg_diff is None:
+            return "無法取得 token 數量資訊，可能是 API 不支援或網路問題。"
+        elif result.passed:
+            return f"平均 token 數偏差為 {avg_diff}%，在可接受範圍內，表示 API 使用的分詞器與宣稱的模型家族一致。"
+        else:
+            return f"平均 token 數偏差為 {avg_diff}%，超過閾值，可能表示 API 使用了不同的分詞器或模型家族。"
+
+    def _interpret_perturbation(self, result: DetectorResult) -> str:
+        """取得微擾穩定性檢測結果的解讀說明。"""
+        top1_pct = result.metrics.get("top1_change_pct")
+        if top1_pct is None:
+            return "無法完成微擾測試，可能是 API 請求失敗。"
+        elif result.passed:
+            return f"Top-1 token 變更率為 {top1_pct}%，在可接受範圍內，表示模型在微小輸入擾動下保持穩定，未檢測到明顯的量化影響。"
+        else:
+            return f"Top-1 token 變更率為 {top1_pct}%，超過閾值，可能表示模型使用了低比特量化或解碼核不穩定。"
+
+    def _interpret_arithmetic(self, result: DetectorResult) -> str:
+        """取得算術與 JSON 檢測結果的解讀說明。"""
+        arith_acc = result.metrics.get("arithmetic_acc")
+        json_valid = result.metrics.get("json_valid_sample")
+        if arith_acc is None:
+            return "無法完成算術測試，可能是 API 請求失敗。"
+        elif result.passed:
+            return f"算術正確率為 {arith_acc}，JSON 輸出合法，表示模型在精確任務上表現良好，未檢測到明顯的量化影響。"
+        else:
+            issues = []
+            threshold = result.metrics.get("threshold_arithmetic", 0.9)
+            if arith_acc < threshold:
+                issues.append(f"算術正確率 ({arith_acc}) 低於閾值 ({threshold})")
+            if not json_valid:
+                issues.append("JSON 輸出不合法")
+            return f"檢測到問題：{', '.join(issues)}。可能表示模型使用了量化或存在強制後處理。"
+
+    def _interpret_style(self, result: DetectorResult) -> str:
+        """取得風格偏移檢測結果的解讀說明。"""
+        prefix_rate = result.metrics.get("fixed_prefix_rate")
+        violation_rate = result.metrics.get("format_violation_rate")
+        if prefix_rate is None:
+            return "無法完成風格測試，可能是 API 請求失敗。"
+        elif result.passed:
+            return f"固定前綴出現率為 {prefix_rate}，格式違規率為 {violation_rate}，均在可接受範圍內，未檢測到明顯的微調影響。"
+        else:
+            issues = []
+            threshold_prefix = result.metrics.get("threshold_prefix", 0.2)
+            threshold_violation = result.metrics.get("threshold_violation", 0.1)
+            if prefix_rate > threshold_prefix:
+                issues.append(f"固定前綴出現率 ({prefix_rate}) 超過閾值 ({threshold_prefix})")
+            if violation_rate > threshold_violation:
+                issues.append(f"格式違規率 ({violation_rate}) 超過閾值 ({threshold_violation})")
+            return f"檢測到問題：{', '.join(issues)}。可能表示模型經過微調，導致行為偏移。"
 
     async def close(self) -> None:
         """關閉資源。
 
-        關閉 API 客戶端連線。
+        關閉 API 客戶端連線與 token 數磁碟快取。
         """
         self.logger.info("關閉 API 客戶端")
         await self.api.close()
+        if self.token_cache is not None:
+            self.token_cache.close()
@@ -3,7 +3,30 @@
 提供 LLM API 客戶端。
 """
 
-from llm_testkit.backend.anthropic_api import AnthropicAPI
-from llm_testkit.backend.openai_api import OpenAICompatibleAPI
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["AnthropicAPI", "OpenAICompatibleAPI"]
+if TYPE_CHECKING:
+    from llm_testkit.backend.anthropic_api import AnthropicAPI
+    from llm_testkit.backend.openai_api import CoalescingAPI, OpenAICompatibleAPI, shutdown_clients
+
+__all__ = ["AnthropicAPI", "CoalescingAPI", "OpenAICompatibleAPI", "shutdown_clients"]
+
+# 名稱 -> 所在子模組，首次存取時才載入（各自只導入所需的 SDK）
+_LAZY_ATTRS = {
+    "AnthropicAPI": ".anthropic_api",
+    "CoalescingAPI": ".openai_api",
+    "OpenAICompatibleAPI": ".openai_api",
+    "shutdown_clients": ".openai_api",
+}
+
+
+def __getattr__(name: str):
+    """延遲導入 API 客戶端，避免載入未使用的 SDK。"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
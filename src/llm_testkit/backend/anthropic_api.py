@@ -4,7 +4,6 @@ from typing import Any
 import anthropic
 import httpx
 from anthropic import DEFAULT_TIMEOUT, AsyncAnthropic
-from anthropic._constants import DEFAULT_CONNECTION_LIMITS
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -12,6 +11,16 @@ from tenacity import (
     wait_exponential,
 )
 
+from llm_testkit.backend.client_cache import SharedClientCache
+
+# Larger pool than the SDK default so bursts of concurrent detector requests to
+# one host reuse warm connections instead of waiting on the pool.
+CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=90,
+)
+
 
 class AnthropicAsyncHttpxClient(httpx.AsyncClient):
     """Custom async HTTP client optimized for long-running inference requests.
@@ -29,9 +38,12 @@ class AnthropicAsyncHttpxClient(httpx.AsyncClient):
         """
         # Set default values from Anthropic SDK
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-        kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
+        limits = kwargs.setdefault("limits", CONNECTION_LIMITS)
         kwargs.setdefault("follow_redirects", True)
 
+        # Multiplex concurrent requests over a single connection when the server supports it
+        kwargs.setdefault("http2", True)
+
         # Configure socket options for long-running requests
         # Based on: https://github.com/anthropics/anthropic-sdk-python/commit/c5387e69e799f14e44006ea4e54fdf32f2f74393
         socket_options = [
@@ -47,13 +59,51 @@ class AnthropicAsyncHttpxClient(httpx.AsyncClient):
 
         # Create custom transport with socket options
         kwargs["transport"] = httpx.AsyncHTTPTransport(
-            limits=DEFAULT_CONNECTION_LIMITS,
+            limits=limits,
+            http2=kwargs["http2"],
             socket_options=socket_options,
         )
 
         super().__init__(**kwargs)
 
 
+def _build_client(base_url: str | None, api_key: str | None) -> AsyncAnthropic:
+    """Create an Anthropic client on a socket-keepalive HTTP client.
+
+    Args:
+        base_url: Custom API endpoint URL, or None for the default endpoint.
+        api_key: Anthropic API key, or None to read it from the environment.
+
+    Returns:
+        The new AsyncAnthropic client.
+
+    Raises:
+        RuntimeError: If client initialization fails.
+    """
+    # Create custom HTTP client with socket keepalive configuration
+    http_client = AnthropicAsyncHttpxClient()
+
+    try:
+        # Initialize Anthropic client with custom HTTP client
+        return AsyncAnthropic(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=http_client,
+        )
+    except Exception as e:
+        raise RuntimeError(f"Failed to initialize Anthropic client: {e}") from e
+
+
+# Every AnthropicAPI instance pointing at the same endpoint with the same
+# credentials (in the same event loop) shares one client and connection pool.
+_CLIENTS: SharedClientCache[AsyncAnthropic] = SharedClientCache(
+    "Anthropic",
+    factory=_build_client,
+    is_closed=lambda client: client.is_closed(),
+    close=lambda client: client.close(),
+)
+
+
 class AnthropicAPI:
     """Anthropic API client for Claude models.
 
@@ -77,32 +127,39 @@ class AnthropicAPI:
         Raises:
             RuntimeError: If client initialization fails.
         """
-        # Create custom HTTP client with socket keepalive configuration
-        http_client = AnthropicAsyncHttpxClient()
-
         # Store model name as instance attribute
         self.model = model_name
 
-        try:
-            # Initialize Anthropic client with custom HTTP client
-            self.client = AsyncAnthropic(
-                api_key=api_key,
-                base_url=base_url,
-                http_client=http_client,
-            )
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize Anthropic client: {e}") from e
+        self._client_key, self.client = _CLIENTS.acquire(base_url, api_key)
+        self._released = False
 
     async def close(self) -> None:
-        """Close the underlying HTTP client.
+        """Release this instance's handle on the shared client.
+
+        The underlying client is shared with every other instance using the same
+        endpoint, credentials and event loop; it is closed when the last of them
+        is closed. Calling ``close()`` more than once is a no-op.
 
         Raises:
             RuntimeError: If an error occurs during client closure.
         """
-        try:
-            await self.client.close()
-        except Exception as e:
-            raise RuntimeError(f"Error closing Anthropic client: {e}") from e
+        if self._released:
+            return
+        self._released = True
+
+        await _CLIENTS.close(self._client_key, self.client)
+
+    @staticmethod
+    async def shutdown_all() -> None:
+        """Close every cached Anthropic client usable from the running event loop.
+
+        Closes the clients created in this loop and those created outside any
+        loop, regardless of outstanding references.
+
+        Raises:
+            RuntimeError: If an error occurs during client closure.
+        """
+        await _CLIENTS.shutdown()
 
     async def __aenter__(self) -> "AnthropicAPI":
         """Enter async context manager.
@@ -113,7 +170,7 @@ class AnthropicAPI:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit async context manager and close the client.
+        """Exit async context manager, releasing the shared client.
 
         Args:
             exc_type: Exception type if an exception occurred.
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Return the running event loop, or None when called outside one.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class SharedClientCache[C]:
+    """Process-wide, refcounted cache of API clients, one per endpoint and event loop.
+
+    Every backend instance pointing at the same endpoint shares one client and
+    therefore one connection pool. Pooled connections are bound to the event loop
+    that opened them, so the cache key includes the running loop (None when the
+    client is acquired outside a loop); entries whose loop has been closed are
+    dropped instead of being reused. The last holder to release a client closes it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[..., C],
+        is_closed: Callable[[C], bool],
+        close: Callable[[C], Awaitable[None]],
+    ) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            name (str): Backend name used in error messages.
+            factory: Builds a client from the arguments passed to ``acquire``.
+            is_closed: Reports whether a client has already been closed.
+            close: Closes a client.
+        """
+        self._name = name
+        self._factory = factory
+        self._is_closed = is_closed
+        self._close = close
+        self._clients: dict[tuple[Hashable, ...], C] = {}
+        self._refs: dict[tuple[Hashable, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, *args: Hashable) -> tuple[tuple[Hashable, ...], C]:
+        """
+        Take a reference on the shared client for ``args``, creating it on first use.
+
+        Args:
+            *args: Endpoint identity, passed to the factory when a client is built.
+
+        Returns:
+            The cache key (pass it to ``release``) and the client.
+        """
+        key = (_running_loop(), *args)
+        with self._lock:
+            # Connections of a closed loop are unusable and can no longer be
+            # closed from another loop
+            for stale in [k for k in self._clients if k[0] is not None and k[0].is_closed()]:
+                del self._clients[stale]
+                self._refs.pop(stale, None)
+
+            client = self._clients.get(key)
+            if client is None or self._is_closed(client):
+                client = self._clients[key] = self._factory(*args)
+                self._refs[key] = 0
+            self._refs[key] += 1
+            return key, client
+
+    def release(self, key: tuple[Hashable, ...], client: C) -> C | None:
+        """
+        Drop a reference taken by ``acquire``.
+
+        Args:
+            key: Cache key returned by ``acquire``.
+            client: Client returned by ``acquire``.
+
+        Returns:
+            The client if this was its last reference (the caller must close it),
+            otherwise None.
+        """
+        with self._lock:
+            if self._clients.get(key) is not client:
+                # Already closed by shutdown(), or evicted with its closed loop
+                return None
+            self._refs[key] -= 1
+            if self._refs[key] > 0:
+                return None
+            del self._clients[key]
+            del self._refs[key]
+            return client
+
+    async def close(self, key: tuple[Hashable, ...], client: C) -> None:
+        """
+        Drop a reference and close the client if it was the last one.
+
+        Args:
+            key: Cache key returned by ``acquire``.
+            client: Client returned by ``acquire``.
+
+        Raises:
+            RuntimeError: If an error occurs while closing the client.
+        """
+        client = self.release(key, client)
+        if client is None:
+            return
+        try:
+            await self._close(client)
+        except Exception as e:
+            raise RuntimeError(f"Error closing {self._name} client: {e}") from e
+
+    async def shutdown(self) -> None:
+        """
+        Close every cached client usable from the running event loop.
+
+        Closes the clients created in this loop and those created outside any loop,
+        regardless of outstanding references.
+
+        Raises:
+            RuntimeError: If an error occurs during client closure.
+        """
+        loop = _running_loop()
+        with self._lock:
+            keys = [k for k in self._clients if k[0] is None or k[0] is loop]
+            clients = [self._clients.pop(k) for k in keys]
+            for k in keys:
+                self._refs.pop(k, None)
+
+        errors = []
+        for client in clients:
+            try:
+                await self._close(client)
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            raise RuntimeError(f"Error closing {self._name} client: {errors[0]}") from errors[0]
+
+    def __len__(self) -> int:
+        """
+        Return the number of cached clients.
+        """
+        with self._lock:
+            return len(self._clients)
@@ -1,29 +1,166 @@
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import random
 import socket
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, Literal
 
 import httpx
 import openai
 from openai import (
-    DEFAULT_CONNECTION_LIMITS,
     DEFAULT_TIMEOUT,
     AsyncOpenAI,
     AuthenticationError,
     NotFoundError,
 )
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
+
+from llm_testkit.backend.client_cache import SharedClientCache
+
+# HTTP statuses worth retrying: request timeout, rate limit and transient
+# upstream failures. Other 4xx responses fail the same way on every attempt.
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """
+    Decide whether a failed request should be retried.
+
+    Args:
+        exc (BaseException): Exception raised by the request.
+
+    Returns:
+        True for connection failures, timeouts and retryable HTTP statuses.
+    """
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError))
+
+
+# Retry budget for generate(): total attempts and the cap on a single backoff.
+_MAX_ATTEMPTS = 3
+_MAX_BACKOFF = 16.0
+
+
+async def _call_with_backoff[T](fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    """
+    Await ``fn(*args, **kwargs)``, retrying transient failures with jittered backoff.
+
+    Waits ``2**attempt`` seconds scaled by a random factor in [0.5, 1.5] (capped
+    at ``_MAX_BACKOFF``) between attempts, so concurrent callers that fail
+    together do not retry in lockstep. The happy path is a single await.
+
+    Args:
+        fn: Coroutine function performing the request.
+        *args: Positional arguments for ``fn``.
+        **kwargs: Keyword arguments for ``fn``.
+
+    Returns:
+        The result of ``fn``.
+
+    Raises:
+        Exception: The last error once attempts are exhausted, or any
+            non-retryable error immediately.
+    """
+    for attempt in range(_MAX_ATTEMPTS - 1):
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            if not _is_retryable(e):
+                raise
+        await asyncio.sleep(min(_MAX_BACKOFF, 2**attempt * random.uniform(0.5, 1.5)))
+    return await fn(*args, **kwargs)
+
+
+# Default pool sizing: far more keep-alive slots than the SDK default so high
+# concurrency reuses warm TLS connections instead of re-handshaking.
+DEFAULT_MAX_CONNECTIONS = 1000
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+def _env_number[N: (int, float)](name: str, default: N, cast: Callable[[str], N]) -> N:
+    """
+    Read a positive number from the environment.
+
+    Args:
+        name (str): Environment variable name.
+        default: Value used when the variable is unset or empty.
+        cast: ``int`` or ``float``.
+
+    Returns:
+        The parsed value, or ``default``.
+
+    Raises:
+        ValueError: If the variable is set to something other than a positive number.
+    """
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    kind = "integer" if cast is int else "number"
+    try:
+        value = cast(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a positive {kind}, got {raw!r}") from None
+    if value <= 0:
+        raise ValueError(f"{name} must be a positive {kind}, got {raw!r}")
+    return value
+
+
+def _connection_limits() -> httpx.Limits:
+    """
+    Build the connection pool limits, honouring environment overrides.
+
+    Reads OPENAI_MAX_CONNECTIONS and OPENAI_KEEPALIVE_EXPIRY when set. The OpenAI
+    client is not built from ``Config``, so these are read from the environment
+    directly.
+
+    Returns:
+        httpx.Limits for the shared HTTP client.
+
+    Raises:
+        ValueError: If either variable is not a positive number.
+    """
+    return httpx.Limits(
+        max_connections=_env_number("OPENAI_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS, int),
+        max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=_env_number("OPENAI_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY, float),
+    )
+
+
+# Every OpenAICompatibleAPI instance pointing at the same endpoint (in the same
+# event loop) shares one HTTP client and connection pool.
+_HTTP_CLIENTS: SharedClientCache["OpenAIAsyncHttpxClient"] = SharedClientCache(
+    "OpenAI",
+    factory=lambda base_url, http2: OpenAIAsyncHttpxClient(http2=http2),
+    is_closed=lambda client: client.is_closed,
+    close=lambda client: client.aclose(),
 )
 
 
+async def shutdown_clients() -> None:
+    """
+    Close every cached HTTP client usable from the running event loop.
+
+    Closes the clients created in this loop and those created outside any loop,
+    regardless of outstanding references. Call once at teardown, from the event
+    loop that used the clients.
+
+    Raises:
+        RuntimeError: If an error occurs during client closure.
+    """
+    await _HTTP_CLIENTS.shutdown()
+
+
 class OpenAICompatibleAPI:
     def __init__(
         self,
         model_name: str,
         base_url: str,
         api_key: str | None = None,
+        http2: bool = True,
     ):
         """
         Initialize the OpenAI Compatible API client.
@@ -32,11 +169,14 @@ class OpenAICompatibleAPI:
             model_name (str): Name of the OpenAI model to use.
             base_url (str): Custom base URL for API requests.
             api_key (Optional[str]): API key for authentication.
+            http2 (bool): Negotiate HTTP/2 when the server offers it. Disable for
+                endpoints with broken h2 support.
         """
         if not base_url:
             raise ValueError("base_url must be provided")
 
-        http_client = OpenAIAsyncHttpxClient()
+        self._http_key, self._http_client = _HTTP_CLIENTS.acquire(base_url, http2)
+        self._released = False
 
         self.model = model_name
 
@@ -44,33 +184,50 @@ class OpenAICompatibleAPI:
             self.client = AsyncOpenAI(
                 api_key=api_key,
                 base_url=base_url,
-                http_client=http_client,
+                http_client=self._http_client,
             )
         except Exception as e:
+            self._released = True
+            _HTTP_CLIENTS.release(self._http_key, self._http_client)
             raise RuntimeError(f"Failed to initialize OpenAI client: {e}") from e
 
     async def close(self) -> None:
         """
-        Close the underlying HTTP client.
+        Release this instance's handle on the shared HTTP client.
+
+        The HTTP client is shared with every other instance using the same
+        endpoint and event loop; it is closed when the last of them is closed.
+        Calling ``close()`` more than once is a no-op.
+
+        Raises:
+            RuntimeError: If an error occurs while closing the HTTP client.
         """
-        try:
-            await self.client.close()
-        except Exception as e:
-            raise RuntimeError(f"Error closing OpenAI client: {e}") from e
+        if self._released:
+            return
+        self._released = True
+
+        await _HTTP_CLIENTS.close(self._http_key, self._http_client)
+
+    async def __aenter__(self) -> "OpenAICompatibleAPI":
+        """
+        Enter async context manager.
+
+        Returns:
+            The OpenAICompatibleAPI instance.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Exit async context manager, releasing the shared HTTP client.
+
+        Args:
+            exc_type: Exception type if an exception occurred.
+            exc_val: Exception value if an exception occurred.
+            exc_tb: Exception traceback if an exception occurred.
+        """
+        await self.close()
 
-    # 設定 API 重試機制（僅對可重試的錯誤進行重試）
-    @retry(
-        stop=stop_after_attempt(3),  # 最多重試 3 次
-        wait=wait_exponential(multiplier=2, min=1, max=16),  # 指數回退機制
-        retry=retry_if_exception_type(
-            (
-                openai.RateLimitError,  # 速率限制
-                openai.APIConnectionError,  # API 連線失敗
-                openai.APIStatusError,  # API 回應狀態碼異常
-                openai.APITimeoutError,  # API 請求超時
-            )
-        ),
-    )
     async def generate(
         self,
         messages: list[dict[str, Any]],
@@ -100,7 +257,9 @@ class OpenAICompatibleAPI:
         """
 
         try:
-            response = await self.client.chat.completions.create(
+            # 僅對可重試的錯誤（連線失敗、超時、408/429/5xx）以帶抖動的指數回退重試
+            response = await _call_with_backoff(
+                self.client.chat.completions.create,
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
@@ -110,22 +269,250 @@ class OpenAICompatibleAPI:
                 parallel_tool_calls=parallel_tool_calls,
             )
             return response
-        except AuthenticationError as e:
-            raise RuntimeError(f"Authentication error: {e}") from e
-        except NotFoundError as e:
-            raise RuntimeError(
+        except Exception as e:
+            error = self._generation_error(e)
+            if error is e:
+                raise
+            raise error from e
+
+    def _generation_error(self, e: Exception) -> Exception:
+        """
+        Map a failed request to the exception raised to callers.
+
+        Authentication and model-not-found errors become RuntimeError with a
+        hint, transient API errors are passed through unchanged, and anything
+        else is wrapped in RuntimeError.
+
+        Args:
+            e (Exception): Exception raised by the request.
+
+        Returns:
+            The exception to raise (``e`` itself when it passes through).
+        """
+        if isinstance(e, AuthenticationError):
+            return RuntimeError(f"Authentication error: {e}")
+        if isinstance(e, NotFoundError):
+            return RuntimeError(
                 f"Model '{self.model}' not found at endpoint. "
                 f"Please check the model name or API endpoint configuration. Error: {e}"
-            ) from e
-        except (
-            openai.RateLimitError,
-            openai.APIConnectionError,
-            openai.APIStatusError,
-            openai.APITimeoutError,
+            )
+        if isinstance(
+            e,
+            (
+                openai.RateLimitError,
+                openai.APIConnectionError,
+                openai.APIStatusError,
+                openai.APITimeoutError,
+            ),
         ):
-            raise
+            return e
+        return RuntimeError(f"Unexpected error during generation: {e}")
+
+    async def generate_user(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.5,
+    ) -> Any:
+        """
+        Generate a response for a single user prompt.
+
+        Builds the one-message ``messages`` payload internally so callers
+        sending plain prompts don't need to allocate it at each call site.
+
+        Args:
+            prompt (str): User message content.
+            max_tokens (int): Maximum number of tokens to generate.
+            temperature (float): Sampling temperature.
+
+        Returns:
+            API response object.
+        """
+        return await self.generate(
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, Any]],
+        max_tokens: int = 2048,
+        temperature: float = 0.5,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive.
+
+        Callers that only need a prefix of the response can stop iterating and
+        ``aclose()`` the generator, which closes the underlying HTTP stream.
+        Opening the stream is retried like ``generate()``; failures while reading
+        it are not, since part of the output may already have been yielded.
+
+        Args:
+            messages (List[Dict[str, Any]]): List of message dictionaries.
+            max_tokens (int): Maximum number of tokens to generate.
+            temperature (float): Sampling temperature.
+
+        Yields:
+            Non-empty content fragments of the first choice.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            RuntimeError: If generation fails due to other errors.
+        """
+        try:
+            stream = await _call_with_backoff(
+                self.client.chat.completions.create,
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=messages,  # type: ignore
+                stream=True,
+            )
         except Exception as e:
-            raise RuntimeError(f"Unexpected error during generation: {e}") from e
+            error = self._generation_error(e)
+            if error is e:
+                raise
+            raise error from e
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and (content := chunk.choices[0].delta.content):
+                    yield content
+        except Exception as e:
+            error = self._generation_error(e)
+            if error is e:
+                raise
+            raise error from e
+        finally:
+            await stream.close()
+
+    def generate_user_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.5,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response for a single user prompt.
+
+        Streaming counterpart of ``generate_user``: builds the one-message
+        ``messages`` payload internally. Close the returned generator with
+        ``aclose()`` when stopping early.
+
+        Args:
+            prompt (str): User message content.
+            max_tokens (int): Maximum number of tokens to generate.
+            temperature (float): Sampling temperature.
+
+        Returns:
+            Async iterator over non-empty content fragments.
+        """
+        return self.generate_stream(
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+
+class CoalescingAPI(OpenAICompatibleAPI):
+    """OpenAI-compatible API wrapper that coalesces identical in-flight requests.
+
+    Deterministic requests (``temperature == 0``) with identical parameters that
+    are issued while an equal request is still pending share its result instead
+    of opening another round-trip. Sampled requests are always forwarded.
+    """
+
+    def __init__(self, inner: OpenAICompatibleAPI):
+        """
+        Wrap an existing API client.
+
+        Args:
+            inner (OpenAICompatibleAPI): Client that performs the actual requests.
+        """
+        self._inner = inner
+        self.model = inner.model
+        self.client = inner.client
+        self._inflight: dict[bytes, asyncio.Future[Any]] = {}
+        # Number of callers currently awaiting each in-flight request
+        self._waiters: dict[bytes, int] = {}
+
+    async def close(self) -> None:
+        """
+        Release the wrapped client.
+        """
+        await self._inner.close()
+
+    async def generate(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: Literal["none", "auto", "required"] | dict[str, Any] = "auto",
+        max_tokens: int = 2048,
+        temperature: float = 0.5,
+        parallel_tool_calls: bool = True,
+    ) -> Any:
+        """
+        Generate a response, sharing the result of an identical pending request.
+
+        Args:
+            messages (List[Dict[str, Any]]): List of message dictionaries.
+            tools (Optional[List[Dict[str, Any]]]): Optional list of tools.
+            tool_choice: Tool choice strategy ("none", "auto", "required", or specific tool).
+            max_tokens (int): Maximum number of tokens to generate.
+            temperature (float): Sampling temperature.
+            parallel_tool_calls (bool): Whether to enable parallel tool calls.
+
+        Returns:
+            API response object (shared between coalesced callers).
+        """
+        params: dict[str, Any] = {
+            "messages": messages,
+            "tools": tools,
+            "tool_choice": tool_choice,
+            "max_tokens": max_tokens,
+            "parallel_tool_calls": parallel_tool_calls,
+        }
+        if temperature != 0:
+            return await self._inner.generate(temperature=temperature, **params)
+
+        key = hashlib.blake2b(
+            json.dumps(params, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        ).digest()
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._inner.generate(temperature=temperature, **params))
+            self._inflight[key] = future
+            self._waiters[key] = 0
+            future.add_done_callback(functools.partial(self._forget, key))
+        self._waiters[key] += 1
+
+        try:
+            # shield: one caller being cancelled must not cancel the request shared with others
+            return await asyncio.shield(future)
+        finally:
+            if self._inflight.get(key) is future:
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0 and not future.done():
+                    # Every caller gave up: stop the shared request instead of
+                    # letting it run (and possibly fail) unobserved.
+                    future.cancel()
+
+    def _forget(self, key: bytes, future: asyncio.Future[Any]) -> None:
+        """
+        Drop a finished request from the in-flight table.
+
+        Args:
+            key (bytes): Request key.
+            future (asyncio.Future): The finished request.
+        """
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            del self._waiters[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved; every waiter already received it
+            future.exception()
 
 
 class OpenAIAsyncHttpxClient(httpx.AsyncClient):
@@ -140,8 +527,11 @@ class OpenAIAsyncHttpxClient(httpx.AsyncClient):
         # This is based on the openai DefaultAsyncHttpxClient:
         # https://github.com/openai/openai-python/commit/347363ed67a6a1611346427bb9ebe4becce53f7e
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-        kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
+        limits = kwargs.setdefault("limits", _connection_limits())
         kwargs.setdefault("follow_redirects", True)
+        # Multiplex concurrent requests over one connection; ALPN falls back
+        # to HTTP/1.1 when the server does not offer h2.
+        http2 = kwargs.setdefault("http2", True)
 
         # This is based on the anthrpopic changes for claude 3.7:
         # https://github.com/anthropics/anthropic-sdk-python/commit/c5387e69e799f14e44006ea4e54fdf32f2f74393#diff-3acba71f89118b06b03f2ba9f782c49ceed5bb9f68d62727d929f1841b61d12bR1387-R1403
@@ -157,7 +547,8 @@ class OpenAIAsyncHttpxClient(httpx.AsyncClient):
             socket_options.append((socket.IPPROTO_TCP, TCP_KEEPIDLE, 60))
 
         kwargs["transport"] = httpx.AsyncHTTPTransport(
-            limits=DEFAULT_CONNECTION_LIMITS,
+            limits=limits,
+            http2=http2,
             socket_options=socket_options,
         )
 
@@ -11,9 +11,11 @@ from llm_testkit.core.metrics import (
     rouge_l,
 )
 from llm_testkit.core.tokenizer import Tokenizer
+from llm_testkit.core.tokenizer_diskcache import TokenCountDiskCache
 
 __all__ = [
     "Tokenizer",
+    "TokenCountDiskCache",
     "exact_match",
     "rouge_l",
     "hamming_distance",
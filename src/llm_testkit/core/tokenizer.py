@@ -3,7 +3,24 @@
 提供統一的分詞器介面，使用 Hugging Face transformers 載入官方分詞器。
 """
 
-from transformers import AutoTokenizer
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from llm_testkit.core.tokenizer_diskcache import TokenCountDiskCache, tokenizer_fingerprint
+
+# token 數快取的預設容量（以文字為鍵）
+COUNT_CACHE_SIZE = 10_000
+
+
+class CountCacheInfo(NamedTuple):
+    """token 數快取統計資訊"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
 
 class Tokenizer:
@@ -17,21 +34,34 @@ class Tokenizer:
 
     Attributes:
         _tokenizer: Hugging Face AutoTokenizer 實例
+        _count_cache: 文字 -> token 數的 LRU 快取
+        _disk_cache: 跨程序共用的 token 數磁碟快取（可選）
     """
 
-    def __init__(self, model_name_or_path: str):
+    def __init__(
+        self,
+        model_name_or_path: str,
+        count_cache_size: int = COUNT_CACHE_SIZE,
+        disk_cache: TokenCountDiskCache | None = None,
+    ):
         """初始化分詞器
 
         Args:
             model_name_or_path: Hugging Face 模型名稱或本地路徑
                 例如: "meta-llama/Llama-3.1-8B", "Qwen/Qwen2.5-7B"
+            count_cache_size: token 數快取容量，設為 0 停用快取
+            disk_cache: token 數磁碟快取；記憶體快取未命中時查詢，None 表示不使用
 
         Raises:
             RuntimeError: 當分詞器載入失敗時
         """
+        # 延遲導入 transformers，避免僅載入套件（如 CLI --help）時付出其初始化成本
+        from transformers import AutoTokenizer
+
         try:
             self._tokenizer = AutoTokenizer.from_pretrained(
                 model_name_or_path,
+                use_fast=True,  # 優先使用 Rust 實作（批次分詞可平行處理）
                 trust_remote_code=True,  # 支援自訂分詞器（如 Qwen）
             )
         except Exception as e:
@@ -43,6 +73,16 @@ class Tokenizer:
                 f"AutoTokenizer.from_pretrained('{model_name_or_path}')\""
             ) from e
 
+        # 每個實例獨立的 LRU 快取；檢測器併發執行時以鎖保護
+        self._count_cache: OrderedDict[str, int] = OrderedDict()
+        self._count_cache_size = count_cache_size
+        self._count_lock = threading.Lock()
+        self._count_hits = 0
+        self._count_misses = 0
+
+        self._disk_cache = disk_cache
+        self._fingerprint = tokenizer_fingerprint(self._tokenizer) if disk_cache else b""
+
     def tokenize(self, text: str) -> list[int]:
         """分詞，回傳 token ID 列表
 
@@ -59,9 +99,31 @@ class Tokenizer:
         """
         return self._tokenizer.encode(text, add_special_tokens=False)
 
+    def tokenize_batch(self, texts: Sequence[str]) -> list[list[int]]:
+        """批次分詞，回傳各文字的 token ID 列表
+
+        一次呼叫底層分詞器處理所有文字（fast tokenizer 會在 Rust 端平行處理）。
+
+        Args:
+            texts: 要分詞的文字列表
+
+        Returns:
+            與輸入順序對應的 token ID 列表
+
+        Examples:
+            >>> tokenizer = Tokenizer("meta-llama/Llama-3.1-8B")
+            >>> tokenizer.tokenize_batch(["Hello world", "Hello"])
+            [[9906, 1917], [9906]]
+        """
+        if not texts:
+            return []
+        return self._tokenizer(list(texts), add_special_tokens=False)["input_ids"]
+
     def count(self, text: str) -> int:
         """計算 token 數量
 
+        結果依文字快取，重複計算相同文字時直接回傳。
+
         Args:
             text: 要計算的文字
 
@@ -73,7 +135,112 @@ class Tokenizer:
             >>> tokenizer.count("Hello world")
             2
         """
-        return len(self.tokenize(text))
+        with self._count_lock:
+            cached = self._count_cache.get(text)
+            if cached is not None:
+                self._count_cache.move_to_end(text)
+                self._count_hits += 1
+                return cached
+            self._count_misses += 1
+
+        return self._count_uncached([text])[text]
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        """批次計算 token 數量
+
+        一次呼叫底層分詞器處理所有文字（fast tokenizer 會在 Rust 端平行處理），
+        避免逐筆跨越 Python/Rust 邊界。已快取的文字不再重新分詞。
+
+        Args:
+            texts: 要計算的文字列表
+
+        Returns:
+            與輸入順序對應的 token 數量列表
+
+        Examples:
+            >>> tokenizer = Tokenizer("meta-llama/Llama-3.1-8B")
+            >>> tokenizer.count_batch(["Hello world", "Hello"])
+            [2, 1]
+        """
+        if not texts:
+            return []
+
+        counts: dict[str, int] = {}
+        with self._count_lock:
+            for text in texts:
+                cached = self._count_cache.get(text)
+                if cached is not None:
+                    self._count_cache.move_to_end(text)
+                    counts[text] = cached
+            hits = sum(1 for text in texts if text in counts)
+            self._count_hits += hits
+            self._count_misses += len(texts) - hits
+
+        missing = list(dict.fromkeys(text for text in texts if text not in counts))
+        if missing:
+            counts.update(self._count_uncached(missing))
+
+        return [counts[text] for text in texts]
+
+    def cache_info(self) -> CountCacheInfo:
+        """取得 token 數快取統計資訊
+
+        Returns:
+            命中數、未命中數、容量與目前項目數
+        """
+        with self._count_lock:
+            return CountCacheInfo(
+                self._count_hits,
+                self._count_misses,
+                self._count_cache_size,
+                len(self._count_cache),
+            )
+
+    def cache_clear(self) -> None:
+        """清除 token 數快取與統計資訊"""
+        with self._count_lock:
+            self._count_cache.clear()
+            self._count_hits = 0
+            self._count_misses = 0
+
+    def _count_uncached(self, texts: list[str]) -> dict[str, int]:
+        """計算記憶體快取未命中的文字 token 數
+
+        先查詢磁碟快取，其餘文字一次批次分詞後寫回磁碟與記憶體快取。
+
+        Args:
+            texts: 不重複的文字列表
+
+        Returns:
+            文字 -> token 數
+        """
+        counts: dict[str, int] = {}
+        if self._disk_cache is not None:
+            counts = self._disk_cache.get_many(self._fingerprint, texts)
+
+        missing = [text for text in texts if text not in counts]
+        if missing:
+            encoded = self._tokenizer(missing, add_special_tokens=False)
+            fresh = {
+                text: len(ids) for text, ids in zip(missing, encoded["input_ids"], strict=True)
+            }
+            if self._disk_cache is not None:
+                self._disk_cache.put_many(self._fingerprint, fresh)
+            counts.update(fresh)
+
+        self._store_counts(counts)
+        return counts
+
+    def _store_counts(self, counts: dict[str, int]) -> None:
+        """寫入 token 數快取，超過容量時淘汰最久未使用的項目"""
+        if self._count_cache_size <= 0:
+            return
+        with self._count_lock:
+            self._count_cache.update(counts)
+            for text in counts:
+                self._count_cache.move_to_end(text)
+            while len(self._count_cache) > self._count_cache_size:
+                self._count_cache.popitem(last=False)
 
     def decode(self, token_ids: list[int]) -> str:
         """解碼 token ID 為文字
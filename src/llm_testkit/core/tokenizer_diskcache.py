@@ -0,0 +1,116 @@
+"""分詞器 token 數磁碟快取模組
+
+以 SQLite 持久化 token 數計算結果，跨程序重複執行審計時免除重新分詞。
+快取鍵為 (分詞器指紋, 文字雜湊)，不同分詞器的結果互不干擾。
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# 預設快取檔案位置
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "llm_testkit" / "tokcounts.sqlite"
+
+
+def tokenizer_fingerprint(tokenizer: Any) -> bytes:
+    """計算分詞器指紋
+
+    以分詞器類別、名稱/路徑、基礎詞表大小與含新增 token 的總詞表大小識別分詞器。
+
+    Args:
+        tokenizer: Hugging Face 分詞器實例
+
+    Returns:
+        16 位元組的指紋
+    """
+    parts = (
+        type(tokenizer).__name__,
+        str(getattr(tokenizer, "name_or_path", "")),
+        str(getattr(tokenizer, "vocab_size", "")),
+        str(len(tokenizer)),
+    )
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).digest()
+
+
+def _text_hash(text: str) -> bytes:
+    """計算文字雜湊（快取鍵）"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class TokenCountDiskCache:
+    """token 數磁碟快取
+
+    使用單一 SQLite 資料表 counts(fp, h, n)，以 WAL 模式支援併發讀取。
+    連線可跨執行緒共用，寫入以鎖保護。
+
+    Attributes:
+        path: 快取檔案路徑
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH):
+        """開啟（必要時建立）快取資料庫
+
+        Args:
+            path: 快取檔案路徑
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS counts ("
+                "fp BLOB NOT NULL, h BLOB NOT NULL, n INTEGER NOT NULL, PRIMARY KEY (fp, h))"
+            )
+
+    def get_many(self, fingerprint: bytes, texts: Iterable[str]) -> dict[str, int]:
+        """查詢多筆文字的 token 數
+
+        Args:
+            fingerprint: 分詞器指紋
+            texts: 要查詢的文字
+
+        Returns:
+            文字 -> token 數（僅包含命中的項目）
+        """
+        by_hash = {_text_hash(text): text for text in texts}
+        if not by_hash:
+            return {}
+
+        found: dict[str, int] = {}
+        hashes = list(by_hash)
+        # 分批查詢，避免超過 SQLite 參數數量上限
+        with self._lock:
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT h, n FROM counts WHERE fp = ? AND h IN ({placeholders})",
+                    (fingerprint, *chunk),
+                )
+                for h, n in rows:
+                    found[by_hash[h]] = n
+        return found
+
+    def put_many(self, fingerprint: bytes, counts: dict[str, int]) -> None:
+        """寫入多筆 token 數（單一交易）
+
+        Args:
+            fingerprint: 分詞器指紋
+            counts: 文字 -> token 數
+        """
+        if not counts:
+            return
+        rows = [(fingerprint, _text_hash(text), n) for text, n in counts.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO counts (fp, h, n) VALUES (?, ?, ?)", rows)
+
+    def close(self) -> None:
+        """關閉資料庫連線"""
+        with self._lock:
+            self._conn.close()
@@ -3,8 +3,9 @@
 提供配置、日誌、I/O 等工具功能。
 """
 
-from llm_testkit.utils.config import Config, load_config, load_yaml
+from llm_testkit.utils.config import Config, load_config, load_yaml, probe_yaml_section_keys
 from llm_testkit.utils.io import (
+    JsonlAppender,
     append_jsonl,
     read_json,
     read_jsonl,
@@ -17,10 +18,12 @@ __all__ = [
     "Config",
     "load_config",
     "load_yaml",
+    "probe_yaml_section_keys",
     "read_json",
     "write_json",
     "read_jsonl",
     "write_jsonl",
     "append_jsonl",
+    "JsonlAppender",
     "setup_logger",
 ]
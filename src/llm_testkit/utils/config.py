@@ -5,11 +5,37 @@
 """
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# 優先使用 libyaml 的 C 實作解析器，未安裝時退回純 Python 版本
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _flatten(config_dict: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """展開巢狀配置字典。
+
+    每一層（含中間層的字典本身）都以點號路徑產出，例如
+    {"llm": {"model": "x"}} 產出 ("llm", {...}) 與 ("llm.model", "x")。
+
+    Args:
+        config_dict: 配置字典
+        prefix: 目前層級的路徑前綴
+
+    Yields:
+        (點號路徑, 配置值)
+    """
+    for key, value in config_dict.items():
+        if not isinstance(key, str):
+            continue
+        path = prefix + key
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, path + ".")
+
 
 class Config:
     """配置管理器。"""
@@ -21,6 +47,8 @@ class Config:
             config_dict: 配置字典
         """
         self._config = config_dict
+        # 預先展開為「點號路徑 -> 值」，查詢時只需一次字典查找
+        self._flat = dict(_flatten(config_dict))
 
     def get(self, key: str, default: Any = None) -> Any:
         """取得配置值（支援點號路徑）。
@@ -32,18 +60,8 @@ class Config:
         Returns:
             配置值
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def __getitem__(self, key: str) -> Any:
         """字典式存取。"""
@@ -51,11 +69,11 @@ class Config:
 
     def __contains__(self, key: str) -> bool:
         """檢查配置鍵是否存在。"""
-        return self.get(key) is not None
+        return self._flat.get(key) is not None
 
     @property
     def raw(self) -> dict[str, Any]:
-        """取得原始配置字典。"""
+        """取得原始配置字典（建立後的修改不會反映到 get）。"""
         return self._config
 
 
@@ -115,7 +133,7 @@ def load_config(config_path: str | Path) -> Config:
         raise FileNotFoundError(f"配置檔不存在: {config_path}")
 
     with config_path.open("r", encoding="utf-8") as f:
-        config_dict = yaml.safe_load(f)
+        config_dict = yaml.load(f, Loader=_SafeLoader)
 
     # 應用環境變數覆蓋
     config_dict = _apply_env_overrides(config_dict or {})
@@ -138,4 +156,84 @@ def load_yaml(filepath: str | Path) -> dict[str, Any]:
         raise FileNotFoundError(f"檔案不存在: {filepath}")
 
     with filepath.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def _skip_yaml_node(event: yaml.Event, events: Iterator[yaml.Event]) -> None:
+    """略過一個 YAML 節點（若為集合則消耗至對應的結束事件）。"""
+    if not isinstance(event, yaml.CollectionStartEvent):
+        return
+
+    depth = 1
+    for e in events:
+        if isinstance(e, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(e, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def probe_yaml_section_keys(filepath: str | Path, section: str) -> set[str] | None:
+    """只解析到指定頂層區塊，取得其下的鍵集合。
+
+    以事件串流解析，只收集該區塊的鍵，不建構任何 Python 物件。
+    與 yaml.load 相同，頂層區塊重複出現時以最後一個為準，因此會掃描到文件結尾。
+    遇到無法在串流中可靠判斷的結構（區塊不存在、非 mapping、使用 merge key 等）時
+    回傳 None，由呼叫端改用完整解析。
+
+    Args:
+        filepath: 檔案路徑
+        section: 頂層區塊名稱（例如：'suites'）
+
+    Returns:
+        區塊下的鍵集合，無法判斷時回傳 None
+    """
+    filepath = Path(filepath)
+
+    if not filepath.exists():
+        raise FileNotFoundError(f"檔案不存在: {filepath}")
+
+    with filepath.open("r", encoding="utf-8") as f:
+        events = iter(yaml.parse(f, Loader=_SafeLoader))
+
+        # 根節點必須是 mapping
+        for event in events:
+            if isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+                continue
+            if not isinstance(event, yaml.MappingStartEvent):
+                return None
+            break
+        else:
+            return None
+
+        keys: set[str] | None = None
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                return keys
+
+            # 頂層 merge key 可能帶入目標區塊，無法在串流中判斷
+            if isinstance(key_event, yaml.ScalarEvent) and key_event.value == "<<":
+                return None
+
+            _skip_yaml_node(key_event, events)
+            value_event = next(events)
+
+            if not (isinstance(key_event, yaml.ScalarEvent) and key_event.value == section):
+                _skip_yaml_node(value_event, events)
+                continue
+
+            if not isinstance(value_event, yaml.MappingStartEvent):
+                return None
+
+            # 重新收集：後出現的同名區塊覆蓋先前的結果
+            keys = set()
+            for sub_event in events:
+                if isinstance(sub_event, yaml.MappingEndEvent):
+                    break
+                if not isinstance(sub_event, yaml.ScalarEvent) or sub_event.value == "<<":
+                    return None
+                keys.add(sub_event.value)
+                _skip_yaml_node(next(events), events)
+
+    return None
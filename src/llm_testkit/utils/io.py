@@ -4,8 +4,41 @@
 """
 
 import json
+import re
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # 缺少 orjson wheel 時退回標準庫 json
+    orjson = None
+
+# 可能超出 64 位元整數範圍的數字序列
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def _jsonl_line(item: Any) -> bytes:
+    """將單筆資料序列化為一行 UTF-8 JSONL（含結尾換行）。"""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(item, option=option)
+    return (json.dumps(item, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """解析 UTF-8 JSON 位元組。
+
+    優先使用 orjson；orjson 不接受的輸入（NaN、Infinity 等）交由標準庫處理，
+    結果與錯誤型別皆與 json.loads 一致。
+    """
+    # orjson 會把超出 64 位元範圍的整數靜默轉成 float，含 19 位以上數字時改用標準庫
+    if orjson is not None and not _LONG_DIGITS_RE.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
 
 
 def read_json(filepath: str | Path) -> dict[str, Any] | list[Any]:
@@ -18,8 +51,8 @@ def read_json(filepath: str | Path) -> dict[str, Any] | list[Any]:
         解析後的資料
     """
     filepath = Path(filepath)
-    with filepath.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # 以位元組一次讀入，省去 TextIOWrapper 的解碼處理
+    return _loads(filepath.read_bytes())
 
 
 def write_json(data: dict[str, Any] | list[Any], filepath: str | Path) -> None:
@@ -32,6 +65,11 @@ def write_json(data: dict[str, Any] | list[Any], filepath: str | Path) -> None:
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        filepath.write_bytes(orjson.dumps(data, option=option))
+        return
+
     with filepath.open("w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -46,14 +84,9 @@ def read_jsonl(filepath: str | Path) -> list[dict[str, Any]]:
         資料列表
     """
     filepath = Path(filepath)
-    data = []
-
-    with filepath.open("r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                data.append(json.loads(line))
-
-    return data
+    # 以位元組讀取，直接交給解析器，省去逐行解碼為 str
+    with filepath.open("rb") as f:
+        return [_loads(line) for line in f if line.strip()]
 
 
 def write_jsonl(data: list[dict[str, Any]], filepath: str | Path) -> None:
@@ -66,23 +99,86 @@ def write_jsonl(data: list[dict[str, Any]], filepath: str | Path) -> None:
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    with filepath.open("w", encoding="utf-8") as f:
-        for item in data:
-            json.dump(item, f, ensure_ascii=False)
-            f.write("\n")
+    # 先組成完整內容再一次寫入
+    filepath.write_bytes(b"".join(map(_jsonl_line, data)))
 
 
 def append_jsonl(data: list[dict[str, Any]], filepath: str | Path) -> None:
     """追加資料到 JSONL 檔案。
 
+    每次呼叫都會開關一次檔案；需連續追加多筆時請改用 JsonlAppender。
+
     Args:
         data: 資料列表
         filepath: 檔案路徑
     """
-    filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with JsonlAppender(filepath) as writer:
+        writer.write_many(data)
+
+
+class JsonlAppender:
+    """持續開啟的 JSONL 追加寫入器。
+
+    在 with 區塊內保持檔案開啟，逐筆寫入時不必重複開關檔案；
+    離開區塊時寫出緩衝並關閉檔案。
+
+    Examples:
+        >>> with JsonlAppender("output/results.jsonl") as writer:
+        ...     for result in results:
+        ...         writer.write(result)
+    """
 
-    with filepath.open("a", encoding="utf-8") as f:
-        for item in data:
-            json.dump(item, f, ensure_ascii=False)
-            f.write("\n")
+    def __init__(self, filepath: str | Path, flush_every: int = 100):
+        """初始化寫入器。
+
+        Args:
+            filepath: 檔案路徑
+            flush_every: 每寫入幾筆即寫出緩衝，設為 0 僅在關閉時寫出
+        """
+        self.filepath = Path(filepath)
+        self.flush_every = flush_every
+        self._file: BinaryIO | None = None
+        self._pending = 0
+
+    def __enter__(self) -> "JsonlAppender":
+        """開啟檔案（必要時建立上層目錄）。"""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.filepath.open("ab")
+        self._pending = 0
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """寫出緩衝並關閉檔案。"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, item: Any) -> None:
+        """追加一筆資料。
+
+        Args:
+            item: 要寫入的資料
+        """
+        self._writer().write(_jsonl_line(item))
+        self._pending += 1
+        if self.flush_every and self._pending >= self.flush_every:
+            self.flush()
+
+    def write_many(self, items: Iterable[Any]) -> None:
+        """一次追加多筆資料。
+
+        Args:
+            items: 要寫入的資料
+        """
+        self._writer().write(b"".join(map(_jsonl_line, items)))
+
+    def flush(self) -> None:
+        """將緩衝內容寫出至檔案。"""
+        self._writer().flush()
+        self._pending = 0
+
+    def _writer(self) -> BinaryIO:
+        """取得已開啟的檔案，未在 with 區塊內使用時拋出錯誤。"""
+        if self._file is None:
+            raise RuntimeError("JsonlAppender 必須在 with 區塊內使用")
+        return self._file
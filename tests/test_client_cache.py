@@ -0,0 +1,104 @@
+"""Tests for the per-event-loop shared client cache."""
+
+import asyncio
+
+import pytest
+
+from llm_testkit.backend.client_cache import SharedClientCache
+
+
+class FakeClient:
+    def __init__(self, *args):
+        self.args = args
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def make_cache():
+    created = []
+
+    def factory(*args):
+        created.append(FakeClient(*args))
+        return created[-1]
+
+    cache = SharedClientCache(
+        "Fake", factory, is_closed=lambda c: c.closed, close=lambda c: c.close()
+    )
+    return cache, created
+
+
+def test_refcounted_sharing_within_loop():
+    async def main():
+        cache, created = make_cache()
+        key_a, a = cache.acquire("url", 1)
+        key_b, b = cache.acquire("url", 1)
+        _, other = cache.acquire("other", 1)
+        assert a is b and a is not other
+        assert a.args == ("url", 1)
+
+        await cache.close(key_a, a)
+        assert not a.closed
+        await cache.close(key_b, b)
+        assert a.closed
+        assert len(cache) == 1
+        assert len(created) == 2
+
+    asyncio.run(main())
+
+
+def test_clients_are_not_shared_across_loops():
+    cache, created = make_cache()
+
+    async def acquire():
+        return cache.acquire("url")
+
+    key_1, first = asyncio.run(acquire())
+    key_2, second = asyncio.run(acquire())
+
+    assert first is not second
+    # The first loop's entry was evicted, so releasing it is a no-op
+    assert cache.release(key_1, first) is None
+    assert not first.closed
+    assert cache.release(key_2, second) is second
+    assert len(cache) == 0
+
+
+def test_closed_client_is_replaced():
+    async def main():
+        cache, _ = make_cache()
+        _, first = cache.acquire("url")
+        await first.close()
+        _, second = cache.acquire("url")
+        assert second is not first
+
+    asyncio.run(main())
+
+
+def test_shutdown_closes_current_loop_and_loopless_clients():
+    cache, _ = make_cache()
+    _, loopless = cache.acquire("url")
+
+    async def main():
+        key, client = cache.acquire("url")
+        await cache.shutdown()
+        assert client.closed and loopless.closed
+        assert len(cache) == 0
+        # Releasing after shutdown does not close twice or raise
+        assert cache.release(key, client) is None
+
+    asyncio.run(main())
+
+
+def test_close_errors_are_wrapped():
+    async def fail(client):
+        raise OSError("boom")
+
+    async def main():
+        cache = SharedClientCache("Fake", FakeClient, is_closed=lambda c: False, close=fail)
+        key, client = cache.acquire("url")
+        with pytest.raises(RuntimeError, match="Error closing Fake client: boom"):
+            await cache.close(key, client)
+
+    asyncio.run(main())
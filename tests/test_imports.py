@@ -0,0 +1,32 @@
+"""套件導入成本測試。"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module", ["llm_testkit", "llm_testkit.main", "llm_testkit.core", "llm_testkit.backend"]
+)
+def test_import_does_not_load_heavy_dependencies(module):
+    # 以子程序導入，避免受目前測試程序已載入的模組影響
+    code = (
+        f"import sys, {module}; "
+        "print(','.join(m for m in ('transformers', 'openai', 'anthropic') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert out == ""
+
+
+def test_import_does_not_touch_tokenizers_parallelism():
+    # 保留 tokenizers 在 fork() 後自動停用平行化的預設行為
+    env = {k: v for k, v in os.environ.items() if k != "TOKENIZERS_PARALLELISM"}
+    code = "import os, llm_testkit.core.tokenizer; print(os.environ.get('TOKENIZERS_PARALLELISM'))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.strip()
+    assert out == "None"
@@ -0,0 +1,57 @@
+"""utils.io JSON / JSONL 讀寫測試。"""
+
+import json
+
+import pytest
+
+from llm_testkit.utils import io
+from llm_testkit.utils.io import JsonlAppender, append_jsonl, read_json, read_jsonl, write_jsonl
+
+# orjson 與 json.loads 行為不同的輸入：NaN、超出 64 位元的整數等
+LINES = [
+    '{"a": NaN}',
+    '{"b": 123456789012345678901234567890}',
+    '{"c": -9223372036854775809}',
+    '{"s": "中文"}',
+    "[1.5, -0, 1e400]",
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """分別以 orjson 與標準庫 json 執行。"""
+    if request.param == "json":
+        monkeypatch.setattr(io, "orjson", None)
+    return request.param
+
+
+def test_read_jsonl_matches_json_loads(tmp_path, json_backend):
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(LINES) + "\n\n", encoding="utf-8")
+
+    expected = [json.loads(line) for line in LINES]
+    assert repr(read_jsonl(path)) == repr(expected)
+
+
+def test_read_json_matches_json_loads(tmp_path, json_backend):
+    path = tmp_path / "data.json"
+    text = "[" + ", ".join(LINES) + "]"
+    path.write_text(text, encoding="utf-8")
+
+    assert repr(read_json(path)) == repr(json.loads(text))
+
+
+def test_jsonl_roundtrip(tmp_path, json_backend):
+    path = tmp_path / "out" / "data.jsonl"
+    write_jsonl([{"a": "中文"}, {"b": [1, None]}], path)
+    append_jsonl([{"c": 1}], path)
+    with JsonlAppender(path, flush_every=1) as writer:
+        writer.write({"d": 2})
+
+    assert read_jsonl(path) == [{"a": "中文"}, {"b": [1, None]}, {"c": 1}, {"d": 2}]
+    assert "中文" in path.read_text(encoding="utf-8")
+
+
+def test_jsonl_appender_requires_context(tmp_path):
+    with pytest.raises(RuntimeError):
+        JsonlAppender(tmp_path / "x.jsonl").write({})
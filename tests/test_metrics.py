@@ -0,0 +1,88 @@
+"""core.metrics 指標計算測試。"""
+
+import random
+
+import pytest
+
+from llm_testkit.core import metrics
+from llm_testkit.core.metrics import _lcs_length, exact_match, json_valid, rouge_l
+
+
+def _reference_lcs(a: str, b: str) -> int:
+    """教科書 O(m·n) 動態規劃，作為對照基準。"""
+    prev = [0] * (len(b) + 1)
+    for ca in a:
+        curr = [0]
+        for j, cb in enumerate(b, 1):
+            curr.append(prev[j - 1] + 1 if ca == cb else max(prev[j], curr[j - 1]))
+        prev = curr
+    return prev[-1]
+
+
+def test_lcs_matches_reference_on_random_strings():
+    rng = random.Random(0)
+    for _ in range(2000):
+        a = "".join(rng.choice("abc中😀") for _ in range(rng.randint(0, 40)))
+        b = "".join(rng.choice("abc中😀") for _ in range(rng.randint(0, 40)))
+        assert _lcs_length(a, b) == _reference_lcs(a, b), (a, b)
+
+
+def test_lcs_matches_reference_with_shared_prefix_and_suffix():
+    rng = random.Random(1)
+    for _ in range(1000):
+        affix = "".join(rng.choice("ab") for _ in range(rng.randint(0, 20)))
+        a = affix + "".join(rng.choice("abc") for _ in range(rng.randint(0, 6))) + affix
+        b = affix + "".join(rng.choice("abc") for _ in range(rng.randint(0, 6))) + affix[::-1]
+        assert _lcs_length(a, b) == _reference_lcs(a, b), (a, b)
+
+
+@pytest.mark.parametrize(
+    ("pred", "ref", "expected"),
+    [
+        ("the cat sat", "the cat sat on mat", 0.7586206896551724),
+        ("hello", "world", 0.2),
+        ("same", "same", 1.0),
+        ("", "abc", 0.0),
+    ],
+)
+def test_rouge_l(pred, ref, expected):
+    assert rouge_l(pred, ref) == pytest.approx(expected)
+
+
+def test_exact_match_ignores_surrounding_whitespace():
+    assert exact_match("hello", "hello") == 1.0
+    assert exact_match(" hello\n", "hello ") == 1.0
+    assert exact_match("hello", "world") == 0.0
+
+
+# json_valid 必須與 json.loads 的判定完全一致（含標準庫接受的 NaN / Infinity）
+JSON_CASES = [
+    ("", False),
+    ("   ", False),
+    ("not json", False),
+    ('hello {"a": 1}', False),
+    ("{}", True),
+    ("[1, 2]", True),
+    (' "x" ', True),
+    ("true", True),
+    ("null", True),
+    ("-1", True),
+    ("12345678901234567890123456789", True),
+    ("NaN", True),
+    ("-Infinity", True),
+    ('{"a": 1', False),
+    ('{"a": 1}}', False),
+    ("1 2", False),
+    ("Nope", False),
+]
+
+
+@pytest.mark.parametrize(("text", "expected"), JSON_CASES)
+def test_json_valid(text, expected):
+    assert json_valid(text) is expected
+
+
+@pytest.mark.parametrize(("text", "expected"), JSON_CASES)
+def test_json_valid_without_orjson(monkeypatch, text, expected):
+    monkeypatch.setattr(metrics, "orjson", None)
+    assert json_valid(text) is expected
@@ -0,0 +1,259 @@
+"""Tests for the OpenAI-compatible backend."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from llm_testkit.backend import openai_api
+from llm_testkit.backend.openai_api import CoalescingAPI, OpenAICompatibleAPI, shutdown_clients
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class FakeAPI:
+    """Stand-in for OpenAICompatibleAPI that counts calls and blocks until released."""
+
+    def __init__(self):
+        self.model = "fake"
+        self.client = None
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def generate(self, **kwargs):
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"call": self.calls, "temperature": kwargs["temperature"]}
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_coalesces_identical_deterministic_requests():
+    async def main():
+        inner = FakeAPI()
+        api = CoalescingAPI(inner)
+        tasks = [asyncio.create_task(api.generate(MESSAGES, temperature=0)) for _ in range(5)]
+        await _settle()
+        inner.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert inner.calls == 1
+        assert all(r is results[0] for r in results)
+        assert api._inflight == {} and api._waiters == {}
+
+    asyncio.run(main())
+
+
+def test_does_not_coalesce_sampled_or_different_requests():
+    async def main():
+        inner = FakeAPI()
+        api = CoalescingAPI(inner)
+        tasks = [
+            asyncio.create_task(api.generate(MESSAGES, temperature=0.7)),
+            asyncio.create_task(api.generate(MESSAGES, temperature=0.7)),
+            asyncio.create_task(api.generate(MESSAGES, temperature=0, max_tokens=1)),
+            asyncio.create_task(api.generate(MESSAGES, temperature=0, max_tokens=2)),
+        ]
+        await _settle()
+        inner.release.set()
+        await asyncio.gather(*tasks)
+
+        assert inner.calls == 4
+
+    asyncio.run(main())
+
+
+def test_cancelling_one_waiter_keeps_shared_request():
+    async def main():
+        inner = FakeAPI()
+        api = CoalescingAPI(inner)
+        first = asyncio.create_task(api.generate(MESSAGES, temperature=0))
+        second = asyncio.create_task(api.generate(MESSAGES, temperature=0))
+        await _settle()
+
+        first.cancel()
+        await _settle()
+        assert inner.cancelled == 0
+
+        inner.release.set()
+        assert (await second)["call"] == 1
+        assert first.cancelled()
+        assert inner.calls == 1
+
+    asyncio.run(main())
+
+
+def test_cancelling_every_waiter_cancels_shared_request():
+    async def main():
+        inner = FakeAPI()
+        api = CoalescingAPI(inner)
+        tasks = [asyncio.create_task(api.generate(MESSAGES, temperature=0)) for _ in range(3)]
+        await _settle()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await _settle()
+
+        assert inner.cancelled == 1
+        assert api._inflight == {} and api._waiters == {}
+
+        # A later identical request starts a fresh call
+        inner.release.set()
+        assert (await api.generate(MESSAGES, temperature=0))["call"] == 2
+
+    asyncio.run(main())
+
+
+def test_errors_reach_every_waiter():
+    class FailingAPI(FakeAPI):
+        async def generate(self, **kwargs):
+            self.calls += 1
+            await self.release.wait()
+            raise ValueError("boom")
+
+    async def main():
+        inner = FailingAPI()
+        api = CoalescingAPI(inner)
+        tasks = [asyncio.create_task(api.generate(MESSAGES, temperature=0)) for _ in range(2)]
+        await _settle()
+        inner.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert inner.calls == 1
+        assert all(isinstance(r, ValueError) for r in results)
+
+    asyncio.run(main())
+
+
+@pytest.fixture
+def clean_client_cache():
+    """Start and end every test with an empty shared-client cache."""
+    assert len(openai_api._HTTP_CLIENTS) == 0
+    yield
+    assert len(openai_api._HTTP_CLIENTS) == 0
+
+
+@pytest.fixture
+def local_server():
+    """Plain HTTP server answering every GET with 200 on a random local port."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_instances_share_client_within_loop(clean_client_cache):
+    async def main():
+        a = OpenAICompatibleAPI("m", "http://example.invalid/v1", api_key="k")
+        b = OpenAICompatibleAPI("m", "http://example.invalid/v1", api_key="k")
+        c = OpenAICompatibleAPI("m", "http://other.invalid/v1", api_key="k")
+        assert a._http_client is b._http_client
+        assert a._http_client is not c._http_client
+
+        await a.close()
+        await a.close()
+        assert not b._http_client.is_closed
+
+        await b.close()
+        await c.close()
+        assert a._http_client.is_closed and c._http_client.is_closed
+        assert len(openai_api._HTTP_CLIENTS) == 0
+
+    asyncio.run(main())
+
+
+def test_shared_client_is_reusable_across_event_loops(clean_client_cache, local_server):
+    clients = []
+
+    async def main():
+        async with OpenAICompatibleAPI("m", local_server, api_key="k") as api:
+            client = api._http_client
+            clients.append(client)
+            response = await client.get(local_server, timeout=5.0)
+            assert response.status_code == 200
+
+    # Each asyncio.run() closes its loop; the second run must not pick up the
+    # first run's client (its pooled connections belong to a closed loop).
+    asyncio.run(main())
+    asyncio.run(main())
+
+    assert clients[0] is not clients[1]
+    assert all(client.is_closed for client in clients)
+    assert len(openai_api._HTTP_CLIENTS) == 0
+
+
+def test_leaked_client_from_closed_loop_is_not_reused(clean_client_cache, local_server):
+    leaked = []
+
+    async def leak():
+        leaked.append(OpenAICompatibleAPI("m", local_server, api_key="k"))
+        await leaked[0]._http_client.get(local_server, timeout=5.0)
+
+    async def main():
+        api = OpenAICompatibleAPI("m", local_server, api_key="k")
+        assert api._http_client is not leaked[0]._http_client
+        response = await api._http_client.get(local_server, timeout=5.0)
+        assert response.status_code == 200
+        # Releasing the stale handle must not touch the new loop's client
+        await leaked[0].close()
+        assert not api._http_client.is_closed
+        await api.close()
+
+    asyncio.run(leak())
+    asyncio.run(main())
+    assert len(openai_api._HTTP_CLIENTS) == 0
+
+
+def test_shutdown_clients_closes_current_loop_clients(clean_client_cache):
+    async def main():
+        api = OpenAICompatibleAPI("m", "http://example.invalid/v1", api_key="k")
+        await shutdown_clients()
+        assert api._http_client.is_closed
+        assert len(openai_api._HTTP_CLIENTS) == 0
+        # close() after shutdown is a no-op
+        await api.close()
+
+    asyncio.run(main())
+
+
+def test_generate_user_stream_builds_single_message_payload(clean_client_cache):
+    async def main():
+        async with OpenAICompatibleAPI("m", "http://example.invalid/v1", api_key="k") as api:
+            sent = []
+
+            async def fake_stream(messages, max_tokens, temperature):
+                sent.append((messages, max_tokens, temperature))
+                yield "a"
+                yield "b"
+
+            api.generate_stream = fake_stream
+            stream = api.generate_user_stream("hi", max_tokens=5, temperature=0)
+            assert [delta async for delta in stream] == ["a", "b"]
+            assert sent == [([{"role": "user", "content": "hi"}], 5, 0)]
+
+    asyncio.run(main())
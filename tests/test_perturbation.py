@@ -0,0 +1,77 @@
+"""微擾穩定性檢測器測試。"""
+
+import asyncio
+
+from llm_testkit.audit.config import DecodingConfig
+from llm_testkit.audit.detectors.perturbation import PerturbationDetector
+
+
+class CharTokenizer:
+    """以字元為 token 並記錄分詞文字長度的假分詞器。"""
+
+    def __init__(self):
+        self.calls = []
+
+    def tokenize(self, text):
+        self.calls.append(len(text))
+        return list(text)
+
+
+class StreamingAPI:
+    """逐字元串流回應並記錄讀取量的假 API。"""
+
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+        self.yielded = 0
+        self.closed = False
+
+    def generate_user_stream(self, prompt, max_tokens=2048, temperature=0.5):
+        self.prompts.append(prompt)
+        return self._stream()
+
+    async def _stream(self):
+        try:
+            for char in self.response:
+                self.yielded += 1
+                yield char
+        finally:
+            self.closed = True
+
+
+def call_api(api, tokenizer):
+    detector = PerturbationDetector()
+    return asyncio.run(detector._call_api(api, tokenizer, "prompt", DecodingConfig()))
+
+
+def test_stream_stops_after_prefix():
+    api = StreamingAPI("x" * 10_000)
+    tokenizer = CharTokenizer()
+    text = call_api(api, tokenizer)
+
+    assert len(text) > 10
+    assert api.yielded < 100
+    assert api.closed
+    assert api.prompts == ["prompt"]
+
+
+def test_tokenization_cost_is_linear_in_response_length():
+    # 分詞器將整段文字視為單一 token，串流會讀完整個回應
+    class OneTokenizer(CharTokenizer):
+        def tokenize(self, text):
+            super().tokenize(text)
+            return [text]
+
+    response = "y" * 5_000
+    api = StreamingAPI(response)
+    tokenizer = OneTokenizer()
+
+    assert call_api(api, tokenizer) == response
+    assert sum(tokenizer.calls) <= 2 * len(response)
+    assert len(tokenizer.calls) < 20
+
+
+def test_short_response_is_returned_whole():
+    api = StreamingAPI("short")
+    assert call_api(api, CharTokenizer()) == "short"
+    assert api.closed
@@ -0,0 +1,90 @@
+"""AuditRunner 套件執行測試。"""
+
+import asyncio
+
+import pytest
+
+from llm_testkit.audit import runner as runner_module
+from llm_testkit.audit.config import (
+    AuditConfig,
+    DecodingConfig,
+    EndpointConfig,
+    RunConfig,
+    ThresholdsConfig,
+    TokenizerConfig,
+)
+from llm_testkit.audit.detectors import DetectorResult
+from llm_testkit.audit.runner import AuditRunner
+
+
+class FakeTokenizer:
+    def __init__(self, **kwargs):
+        pass
+
+
+class SlowDetector:
+    """記錄同時執行數的假檢測器。"""
+
+    def __init__(self, name, state):
+        self.name = name
+        self.state = state
+
+    async def run(self, api, tokenizer, decoding, thresholds):
+        self.state["running"] += 1
+        self.state["peak"] = max(self.state["peak"], self.state["running"])
+        await asyncio.sleep(0.01)
+        self.state["running"] -= 1
+        return DetectorResult(name=self.name, passed=True, metrics={})
+
+
+def make_runner(monkeypatch, names, **run_kwargs):
+    monkeypatch.setattr(runner_module, "Tokenizer", FakeTokenizer)
+    config = AuditConfig(
+        endpoint=EndpointConfig(url="http://127.0.0.1:9/v1", model="m", api_key="k"),
+        tokenizer=TokenizerConfig(model_name_or_path="fake"),
+        decoding=DecodingConfig(),
+        suites={"all": names},
+        thresholds=ThresholdsConfig(),
+        run=RunConfig(**run_kwargs),
+    )
+    runner = AuditRunner(config)
+    state = {"running": 0, "peak": 0}
+    runner.detectors = {name: SlowDetector(name, state) for name in names}
+    return runner, state
+
+
+@pytest.mark.parametrize(("parallel", "peak"), [(None, 1), (1, 1), (2, 2), (10, 4)])
+def test_run_suite_bounds_concurrency_by_parallel(monkeypatch, parallel, peak):
+    names = ["d1", "d2", "d3", "d4"]
+    kwargs = {} if parallel is None else {"parallel": parallel}
+
+    async def main():
+        runner, state = make_runner(monkeypatch, names, **kwargs)
+        try:
+            results = await runner.run_suite_list("all")
+        finally:
+            await runner.close()
+        assert [r.name for r in results] == names
+        assert state["peak"] == peak
+
+    asyncio.run(main())
+
+
+def test_run_suite_reports_unknown_and_failing_detectors(monkeypatch):
+    class BrokenDetector:
+        async def run(self, **kwargs):
+            raise ValueError("boom")
+
+    async def main():
+        runner, _ = make_runner(monkeypatch, ["ok", "missing", "broken"], parallel=3)
+        del runner.detectors["missing"]
+        runner.detectors["broken"] = BrokenDetector()
+        try:
+            results = {r.name: r for r in await runner.run_suite_list("all")}
+        finally:
+            await runner.close()
+        assert results["ok"].passed
+        assert not results["missing"].passed and "未註冊" in results["missing"].notes
+        assert not results["broken"].passed and "boom" in results["broken"].notes
+
+    asyncio.run(main())
@@ -0,0 +1,176 @@
+"""分詞器指紋檢測器測試。"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from llm_testkit.audit.config import DecodingConfig, ThresholdsConfig
+from llm_testkit.audit.detectors.tokenizer_fingerprint import TokenizerFingerprintDetector
+
+PROMPTS = TokenizerFingerprintDetector.PROMPTS
+
+
+class FakeTokenizer:
+    """以字元數作為 token 數的假分詞器。"""
+
+    def __init__(self):
+        self.batches = []
+
+    def count_batch(self, texts):
+        self.batches.append(list(texts))
+        return [len(text) for text in texts]
+
+
+class FakeAPI:
+    """依提示回傳 usage.prompt_tokens 的假 API。
+
+    遠端 token 數 = 每請求開銷 + 訊息數 × 每則訊息開銷 + Σ(本地 token 數 + 差值)。
+
+    Args:
+        extra: 各提示遠端 token 數相對本地的差值
+        delays: 各提示的回應延遲（秒）
+        fail: 請求失敗的提示索引
+        request_overhead: 每請求的聊天模板開銷
+        turn_overhead: 每則訊息的聊天模板開銷
+    """
+
+    def __init__(self, extra=None, delays=None, fail=(), request_overhead=0, turn_overhead=0):
+        self.extra = extra or {}
+        self.delays = delays or {}
+        self.fail = set(fail)
+        self.request_overhead = request_overhead
+        self.turn_overhead = turn_overhead
+        self.prompts = []
+        self.requests = 0
+        self.cancelled = 0
+
+    async def generate(self, messages, max_tokens=2048, temperature=0.5, **kwargs):
+        self.requests += 1
+        indices = [PROMPTS.index(m["content"]) for m in messages]
+        if len(indices) == 1:
+            try:
+                await asyncio.sleep(self.delays.get(indices[0], 0))
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        if self.fail.intersection(indices):
+            raise RuntimeError("request failed")
+        prompt_tokens = self.request_overhead + sum(
+            self.turn_overhead + len(PROMPTS[idx]) + self.extra.get(idx, 0) for idx in indices
+        )
+        return SimpleNamespace(usage=SimpleNamespace(prompt_tokens=prompt_tokens))
+
+    async def generate_user(self, prompt, max_tokens=2048, temperature=0.5):
+        self.prompts.append(prompt)
+        return await self.generate(
+            [{"role": "user", "content": prompt}], max_tokens=max_tokens, temperature=temperature
+        )
+
+
+def run_detector(api, tokenizer=None, threshold=2.0, **decoding):
+    detector = TokenizerFingerprintDetector()
+    return asyncio.run(
+        detector.run(
+            api=api,
+            tokenizer=tokenizer or FakeTokenizer(),
+            decoding=DecodingConfig(**decoding),
+            thresholds=ThresholdsConfig(fingerprint_avg_diff_pct=threshold),
+        )
+    )
+
+
+def test_matching_counts_pass():
+    tokenizer = FakeTokenizer()
+    result = run_detector(FakeAPI(), tokenizer)
+
+    assert result.passed
+    assert result.metrics["avg_token_diff_pct"] == 0
+    assert result.metrics["samples"] == len(PROMPTS)
+    assert result.metrics["success_rate"] == 1.0
+    # 本地 token 數以單次批次呼叫取得
+    assert tokenizer.batches == [list(PROMPTS)]
+
+
+def test_early_exit_once_failure_is_certain():
+    # 第一個樣本偏差極大，其餘樣本即使偏差為 0 平均仍超過閾值
+    api = FakeAPI(extra={0: 1000}, delays={1: 5, 2: 5, 3: 5})
+    result = run_detector(api)
+
+    assert not result.passed
+    assert result.metrics["early_exit"]
+    assert result.metrics["samples"] == 1
+    assert result.metrics["skipped_samples"] == len(PROMPTS) - 1
+    assert api.cancelled == len(PROMPTS) - 1
+    # 略過的樣本不計入成功率
+    assert result.metrics["success_rate"] == 1.0
+    assert "略過剩餘" in result.notes
+
+
+def test_no_early_exit_while_outcome_is_open():
+    # 偏差小於閾值時需等待所有樣本
+    api = FakeAPI(extra={0: 1}, delays={1: 0.01, 2: 0.01, 3: 0.01})
+    result = run_detector(api, threshold=50.0)
+
+    assert result.passed
+    assert not result.metrics["early_exit"]
+    assert result.metrics["samples"] == len(PROMPTS)
+    assert result.metrics["skipped_samples"] == 0
+    assert api.cancelled == 0
+
+
+def test_success_rate_counts_failed_requests():
+    result = run_detector(FakeAPI(fail={2}))
+
+    assert result.passed
+    assert result.metrics["failed_samples"] == 1
+    assert result.metrics["success_rate"] == 0.75
+    assert "1 個樣本請求失敗" in result.notes
+
+
+def test_row_marshal_passes_with_measured_overhead():
+    api = FakeAPI(request_overhead=5, turn_overhead=3)
+    # 逐筆模式同樣將模板開銷計入偏差
+    assert run_detector(FakeAPI(request_overhead=5, turn_overhead=3), threshold=45).passed
+
+    result = run_detector(api, threshold=45, row_marshal_fingerprint=True)
+
+    assert result.passed
+    assert result.metrics["row_marshal"]
+    assert result.metrics["request_overhead_tokens"] == 5
+    assert api.requests == 3
+    # 總偏差：4 個請求各含 5 + 3 個模板 token
+    assert result.metrics["avg_token_diff_pct"] == round(32 / sum(map(len, PROMPTS)) * 100, 2)
+
+
+def test_row_marshal_exact_match_without_template():
+    api = FakeAPI()
+    result = run_detector(api, row_marshal_fingerprint=True)
+
+    assert result.passed
+    assert result.metrics["row_marshal"]
+    assert result.metrics["avg_token_diff_pct"] == 0
+    assert api.requests == 3
+
+
+@pytest.mark.parametrize(
+    ("api_kwargs", "threshold"),
+    [
+        # 逐筆平均偏差超過閾值
+        ({"extra": {0: 10, 1: 10, 2: 10, 3: 10}}, 2.0),
+        # 總偏差在閾值內，但逐筆平均（短提示權重較高）超過閾值
+        ({"request_overhead": 1, "turn_overhead": 2}, 8.0),
+        # 請求失敗
+        ({"fail": {3}}, 2.0),
+    ],
+)
+def test_row_marshal_defers_to_per_prompt_verdict(api_kwargs, threshold):
+    per_prompt = run_detector(FakeAPI(**api_kwargs), threshold=threshold)
+
+    api = FakeAPI(**api_kwargs)
+    result = run_detector(api, threshold=threshold, row_marshal_fingerprint=True)
+
+    assert "row_marshal" not in result.metrics
+    assert result.passed == per_prompt.passed
+    assert result.metrics == per_prompt.metrics
+    assert api.requests == 3 + len(PROMPTS)